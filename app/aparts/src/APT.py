@@ -1,10 +1,12 @@
 import io
 import os
 import re
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from fnmatch import fnmatch
-from shutil import copy2
+from functools import partial
+from shutil import copy2, which
 
-import Levenshtein
 import pandas as pd
 from anyascii import anyascii
 from pybtex.database import parse_file
@@ -598,6 +600,14 @@ culicid_genera = [
             "Zeugnomyia",
         ]
 
+# translation tables to strip markup in a single pass
+author_markup_table = str.maketrans("", "", "{}.")
+journal_markup_table = str.maketrans({"{": None, "}": None, ".": None, "&": "and", "\\": None, ":": None, ";": None})
+keyword_markup_table = str.maketrans("", "", "'[]\\{}")
+list_markup_table = str.maketrans("", "", "'[]")
+filename_table = str.maketrans(dict.fromkeys(':;=.{}?,\\/*"\'', "_"))
+illegal_filename_characters = re.compile(r'[\\\/_\{\}<>?%*:\|\"\'\s]')
+
 
 ### subroutines
 
@@ -677,6 +687,20 @@ def guarantee_csv_exists(filename:str, df:pd.DataFrame) -> None:
         df.to_csv(filename, index = False)
     return
 
+def read_table(filename:str, separator:str = ",") -> pd.DataFrame:
+    """Read a table from parquet if the filename ends with .parquet, otherwise from csv."""
+    if filename.endswith(".parquet"):
+        return pd.read_parquet(filename)
+    return pd.read_csv(filename, sep = separator)
+
+def write_table(dataframe:pd.DataFrame, filename:str, separator:str = ",") -> None:
+    """Store a table as zstd compressed parquet if the filename ends with .parquet, otherwise as csv."""
+    if filename.endswith(".parquet"):
+        dataframe.to_parquet(filename, index = False, compression = "zstd")
+    else:
+        dataframe.to_csv(filename, index = False, sep = separator)
+    return
+
 ## indexing
 def list_filenames(folder:str, type:str) -> list:
     """
@@ -739,7 +763,24 @@ def remove_trailing_backslashes(string:str)->str:
     )
     return string
 
-def pdf2txtfolder(PDFfolder: str, TXTfolder: str) -> None:
+def extract_pages_pypdf(filename: str) -> list:
+    """Extract the text of each page of a pdf file using PyPDF2."""
+    with open(filename, "rb") as f:
+        read_pdf = PdfReader(f)
+        return [page.extract_text() for page in read_pdf.pages]
+
+def extract_pages_pdftotext(filename: str) -> list:
+    """Extract the text of each page of a pdf file using poppler's pdftotext. Returns an empty list if no text could be extracted."""
+    process = subprocess.run(["pdftotext", "-enc", "UTF-8", filename, "-"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    text = process.stdout.decode("utf-8", errors="replace")
+    if process.returncode != 0 or not text.strip():
+        return []
+    pages = text.split("\f")
+    if pages[-1] == "":
+        pages.pop()
+    return pages
+
+def pdf2txtfolder(PDFfolder: str, TXTfolder: str, use_pdftotext: bool = False, processes: int = None) -> None:
     """
     Convert all PDF files in a given folder to txt files.
 
@@ -749,6 +790,10 @@ def pdf2txtfolder(PDFfolder: str, TXTfolder: str) -> None:
     
     TXTfolder (str): Path to the folder in which the extracted text should be stored.
 
+    use_pdftotext (bool): Extract text with poppler's pdftotext when it is installed, running several conversions at once. Files for which pdftotext returns no text fall back to PyPDF2.
+
+    processes (int): Maximum number of simultaneous pdftotext conversions. Defaults to the number of cpu cores.
+
     Returns:
     --------
     None
@@ -758,6 +803,7 @@ def pdf2txtfolder(PDFfolder: str, TXTfolder: str) -> None:
     input_file_list = list_filenames(folder=PDFfolder, type="*.pdf")
     output_file_list = list_filenames(folder=TXTfolder, type="*.txt")
     # add txt files for pdfs that haven't been processed while correcting eof
+    pending_files = []
     for file_ in input_file_list:
         if str(file_) not in output_file_list:
             if os.path.isfile(f"{TXTfolder}/{file_}.txt") == False:
@@ -766,23 +812,28 @@ def pdf2txtfolder(PDFfolder: str, TXTfolder: str) -> None:
                     contents_eof_corrected = reset_eof_of_pdf_return_stream(contents)
                 with open(f"{PDFfolder}/{file_}.pdf", "wb") as d:
                     d.writelines(contents_eof_corrected)
+                pending_files.append(file_)
 
-                # create txt with the same name in the output folder
-                with open(f"{TXTfolder}/{file_}.txt", "w+") as t:
-                    with open(f"{PDFfolder}/{file_}.pdf", "rb") as f:
-                        read_pdf = PdfReader(f)
-                        number_of_pages = len(read_pdf.pages)
-                        # write page content to files
-                        for i in range(number_of_pages):
-                            page = read_pdf.pages[i]
-                            page_content = page.extract_text()
-                            page_content_utf8 = convert_unicode_from_string(page_content)
-                            page_content_utf8 = remove_trailing_backslashes(page_content_utf8)
-                            # save the extracted data from pdf to a txt file with one line per page
-                            t.write(str(page_content_utf8.encode()))
-                            t.write("\n")
-                            # print(i+1,"/",number_of_pages)
-                print("converted ", str(file_)[0:30], "... to txt")
+    pdf_files = [f"{PDFfolder}/{file_}.pdf" for file_ in pending_files]
+    if use_pdftotext and which("pdftotext"):
+        with ThreadPoolExecutor(max_workers=processes or os.cpu_count()) as executor:
+            extracted_pages = list(executor.map(extract_pages_pdftotext, pdf_files))
+    else:
+        extracted_pages = [[] for file_ in pending_files]
+
+    for file_, pdf_file, pages in zip(pending_files, pdf_files, extracted_pages):
+        if not pages:
+            pages = extract_pages_pypdf(pdf_file)
+        # create txt with the same name in the output folder
+        with open(f"{TXTfolder}/{file_}.txt", "w+") as t:
+            # write page content to files
+            for page_content in pages:
+                page_content_utf8 = convert_unicode_from_string(page_content)
+                page_content_utf8 = remove_trailing_backslashes(page_content_utf8)
+                # save the extracted data from pdf to a txt file with one line per page
+                t.write(str(page_content_utf8.encode()))
+                t.write("\n")
+        print("converted ", str(file_)[0:30], "... to txt")
     return
 
 def unicodecleanup_folder(TXTfolder: str, TXTCorfolder: str):
@@ -818,20 +869,19 @@ def unicodecleanup_folder(TXTfolder: str, TXTCorfolder: str):
 
 def sort_joined_list(input_list:list) -> list:
     """
-    Returns a sorted list with only the unique values of the input list.
+    Returns a list with only the unique values of the input list, in order of first appearance.
 
     Parameters:
     input_list: a list of values.
 
     Returns:
-    A sorted list of unique values in input_list.
+    A list of unique values in input_list.
     """
-    return list(set(input_list))
+    return list(dict.fromkeys(input_list))
 
 def filter_uniques_from_list(List:list)->list:
     """Filter uniques in list of strings."""
-    List = sorted(list(set(List)))
-    return List
+    return sorted(set(List))
 
 def set_additional_keywords(alternate_lists:str) -> list:
     """
@@ -895,8 +945,7 @@ def fix_broken_words(text:str)->str:
 
 def remove_special_characters(text: str) -> str:
     """Delete illegal characters for filenames from a string."""
-    illegal_chars = r'[\\\/_\{\}<>?%*:\|\"\'\s]'  # Regular expression pattern
-    cleaned_text = re.sub(illegal_chars, '', text)
+    cleaned_text = illegal_filename_characters.sub('', text)
     return cleaned_text
 
 def author_to_firstname_lastname(row: pd.Series, author_column:str = "author") -> list:
@@ -920,7 +969,7 @@ def author_to_firstname_lastname(row: pd.Series, author_column:str = "author") -
         if "and " in authors:
             names = authors.split("and ")
             for name in names:
-                name = name.replace("{","").replace("}","").replace(".","")
+                name = name.translate(author_markup_table)
                 if ", " in name:
                     lastname, firstname = name.split(", ")
                     if firstname.endswith(" "):
@@ -950,29 +999,17 @@ def correct_authornames(filepath: str, separator: str = ",", title_column: str =
     separator (str): Delimiter of the input file.
     """
     path = str(filepath)
-    dataframe = pd.read_csv(path, sep = separator)
+    dataframe = read_table(path, separator)
     data = {}
     for index, row in dataframe.iterrows():
         if not pd.isna(row[title_column]):
-            name = []
-            authorlist_corrected = []
             authorlist = author_to_firstname_lastname(row, author_column)
-            for ele in authorlist:
-                if str(ele) != "empty":
-                    name = (
-                        str(ele)
-                        .replace("{", "")
-                        .replace("}", "")
-                        .replace(".", "")
-                    )
-                    authorlist_corrected.append(name)
-            authorlist_corrected = ", ".join(authorlist_corrected)
-            pd_row = pd.DataFrame({"author_corrected": [authorlist_corrected]}, index=[0])
-            data[index] = pd_row
+            authorlist_corrected = [str(ele).translate(author_markup_table) for ele in authorlist if str(ele) != "empty"]
+            data[index] = ", ".join(authorlist_corrected)
     # repopulate author_corrected column with name surname
-    for index, pd_row in data.items():
-        dataframe.at[index, "author_corrected"] = pd_row["author_corrected"][0]
-    dataframe.to_csv(filepath, index=False, sep=separator)
+    for index, authors in data.items():
+        dataframe.at[index, "author_corrected"] = authors
+    write_table(dataframe, path, separator)
     return
 
 def collapse_authors(names:list)->list:
@@ -1000,17 +1037,8 @@ def collapse_authors(names:list)->list:
         # Create a key using initials and last name
         key = ''.join(initials) + ' ' + last_name
         
-        # Check if the key already exists in the collapsed_names dictionary
-        if key in collapsed_names:
-            # Compare the current name with the stored name using Levenshtein distance
-            current_distance = Levenshtein.distance(name, collapsed_names[key])
-            stored_distance = Levenshtein.distance(collapsed_names[key], name)
-            
-            # If the current name is longer or has a smaller distance, update the dictionary value
-            if len(name) > len(collapsed_names[key]) or current_distance < stored_distance:
-                collapsed_names[key] = name
-        else:
-            # If the key doesn't exist, add the name to the dictionary
+        # Keep the longest variant of each key; the edit distance between two names is symmetric, so it never decides between them
+        if key not in collapsed_names or len(name) > len(collapsed_names[key]):
             collapsed_names[key] = name
     
     # Return the values of the collapsed_names dictionary
@@ -1041,7 +1069,7 @@ def populate_placeholders(placeholderlist:list, valuelist:list, record:pd.Series
         value = str(record[value_key])  
         if placeholder == "VALUE:journal":
             if value != "nan":
-                value = value.replace("{", "").replace("}", "").replace(".", "").replace("&", "and").replace("\\\\", "").replace("\\", "").replace(":", "").replace(";", "")
+                value = value.translate(journal_markup_table)
             data = data.replace(placeholder, value)
         elif placeholder == "VALUE:keywords":
             if value != "nan":
@@ -1096,27 +1124,19 @@ def calculate_tag_counts(taglists, separator:str = ", ") -> pd.DataFrame:
     tagcounts (pd.DataFrame): DataFrame containing the calculated counts per keyword over the entire corpus, ordered by occurrence
     """
 
-    tag_counts = {}
-    def count_items(string_list: list):
-        for item in string_list:
-            if item in tag_counts:
-                tag_counts[item] += 1
-            else:
-                tag_counts[item] = 1
-    
     if isinstance(taglists, list) and all(isinstance(sublist, list) for sublist in taglists):
-        for item in taglists:
-            count_items(item)
+        taglist = [item for sublist in taglists for item in sublist]
     elif isinstance(taglists, list):
-        count_items(taglists)
+        taglist = taglists
     elif isinstance(taglists, pd.Series):
         split_list = [str(item).split(separator) for item in taglists]
         taglist = [item for sublist in split_list for item in sublist]
-        count_items(taglist)
     else:
         print("please use a supported type: list, str or pd.Series")
+        taglist = []
 
-    tag_counts = pd.DataFrame({"keyword": list(tag_counts.keys()), "count": list(tag_counts.values())})
+    counts = pd.Series(taglist, dtype=object).value_counts(sort=False, dropna=False)
+    tag_counts = pd.DataFrame({"keyword": counts.index, "count": counts.values})
 
     tag_counts = tag_counts.sort_values(by="count", ascending=False)
 
@@ -1124,7 +1144,37 @@ def calculate_tag_counts(taglists, separator:str = ", ") -> pd.DataFrame:
 
 
 ## scan the txt files for strings contained in the keylist
-def tag_folder(TXTCorfolder: str = "input/pdf/docs/corrected", keylist_path: str = "input/keylist.csv", outputCSV: str = "output/csv/keywords.csv", alternate_lists: str = "none", print_to_console: bool = False, separator: str = ";")-> None:
+def _map_files(function, files: list, processes: int = 1):
+    """Apply function to each file, spreading the files over a pool of worker processes if processes > 1."""
+    if processes > 1:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            yield from executor.map(function, files, chunksize=4)
+    else:
+        yield from map(function, files)
+
+def tag_file(filename: str, keylist: list) -> list:
+    """
+    Scans a txt file for keywords from the given list.
+
+    Parameters:
+    -----------
+    filename (str): Path to the unicode corrected txt file.
+
+    keylist (list): List of strings containing the keywords of interest.
+
+    Return:
+    -----------
+    unique_keywords (list): Sorted list of the unique keywords found.
+    """
+    keywords = []
+    with open(filename, "rb") as file:
+        for line in file:
+            text = preprocess_text(line)
+            keywords = find_keywords(keylist, text)
+    unique_keywords = filter_uniques_from_list(keywords)
+    return unique_keywords
+
+def tag_folder(TXTCorfolder: str = "input/pdf/docs/corrected", keylist_path: str = "input/keylist.csv", outputCSV: str = "output/csv/keywords.csv", alternate_lists: str = "none", print_to_console: bool = False, separator: str = ";", processes: int = 1)-> None:
     """
     Scans all txt files in a given folder for keywords from the supplied csv file and any alternate lists specified. The output is stored as csv with the filename as index.
     
@@ -1140,6 +1190,8 @@ def tag_folder(TXTCorfolder: str = "input/pdf/docs/corrected", keylist_path: str
 
     print_to_console (bool): Whether a summary of the output should be shown in console log
 
+    processes (int): Number of worker processes used to tag files in parallel. Default is 1 (no parallelism).
+
     Return:
     -----------
     None
@@ -1152,25 +1204,19 @@ def tag_folder(TXTCorfolder: str = "input/pdf/docs/corrected", keylist_path: str
     guarantee_csv_exists(outputCSV, df)
 
     outputfile = pd.read_csv(outputCSV, sep = separator)["file"].tolist()
-    itemlist = list_filenames(TXTCorfolder, "*.txt")
+    itemlist = [item for item in list_filenames(TXTCorfolder, "*.txt") if str(item) not in outputfile]
+    files = [f"{TXTCorfolder}/{item}.txt" for item in itemlist]
     taglists = []
     
-    for item in itemlist:
-        if str(item) not in outputfile:
-            with open(f"{TXTCorfolder}/{item}.txt", "rb") as file:
-                for line in file:
-                    text = preprocess_text(line)
-                    keywords = find_keywords(keylist, text)
-                unique_keywords = filter_uniques_from_list(keywords)
-
-                taglists.append(unique_keywords)  # Add tags from current document to taglists
-
-                # create pandas row
-                dfcolumn = pd.DataFrame(
-                    {"file": str(item), "keywords": str(unique_keywords)}, index=[0]
-                )
-                dfcolumn.to_csv(outputCSV, mode="a", index=False, header=False, sep=separator)
-            print(f"tagged {item}")
+    for item, unique_keywords in zip(itemlist, _map_files(partial(tag_file, keylist=keylist), files, processes)):
+        taglists.append(unique_keywords)  # Add tags from current document to taglists
+
+        # create pandas row
+        dfcolumn = pd.DataFrame(
+            {"file": str(item), "keywords": str(unique_keywords)}, index=[0]
+        )
+        dfcolumn.to_csv(outputCSV, mode="a", index=False, header=False, sep=separator)
+        print(f"tagged {item}")
     
     print("finished writing tags to keywords.csv")
     tagcounts = calculate_tag_counts(taglists)
@@ -1236,13 +1282,14 @@ def tag_csv(inputCSV: str, outputCSV: str = "", outputfolder: str = "C:/NLPvenv/
         print(tagcounts)
     return
 
-def tag_file_weighted(filename: str, keylist_path: str = "input/keylist.csv", alternate_lists: str ="all", treshold: int = 2, print_to_console: bool = False) -> dict[str, int]:
+def tag_file_weighted(filename: str, keylist_path: str = "input/keylist.csv", alternate_lists: str ="all", treshold: int = 2, print_to_console: bool = False, keylist: list = None) -> dict[str, int]:
     """
-    Scans a file for tags and weighs them based on the counts and locations of each occurrence within the document.
+    Scans a file for tags and weighs them based on the counts and locations of each occurrence within the document. A prebuilt keylist may be passed to skip reading keylist_path.
     """
     section_dictionary = split_text_to_sections(filename)
-    keylist = construct_keylist(
-        keylist_path, alternate_lists)
+    if keylist is None:
+        keylist = construct_keylist(
+            keylist_path, alternate_lists)
     word_counts = count_keyword_occurrences(section_dictionary, keylist)
     word_counts_filtered = filter_values(word_counts, 1)
     word_counts_weighed = weigh_keywords(word_counts_filtered)
@@ -1252,7 +1299,7 @@ def tag_file_weighted(filename: str, keylist_path: str = "input/keylist.csv", al
         print_nested_dict(denested)
     return denested
 
-def tag_folder_weighted(input_path: str, outputCSV: str = "output/csv/keywords.csv", keylist_path: str = "input/keylist.csv", alternate_lists: str = "all", treshold: int = 2,  print_to_console: bool = False, separator: str = ",") -> None:
+def tag_folder_weighted(input_path: str, outputCSV: str = "output/csv/keywords.csv", keylist_path: str = "input/keylist.csv", alternate_lists: str = "all", treshold: int = 2,  print_to_console: bool = False, separator: str = ",", processes: int = 1) -> None:
     """
     Scans each file within a folder for tags and weighs them based on the counts and locations of each occurrence within the document. Saves the data to a csv file in the provided folder and prints the data if output is set to True
 
@@ -1264,6 +1311,8 @@ def tag_folder_weighted(input_path: str, outputCSV: str = "output/csv/keywords.c
 
     print_to_console (bool): whether a summary of the output should be shown in console log
 
+    processes (int): Number of worker processes used to tag files in parallel. Default is 1 (no parallelism).
+
     Return:
     -----------
     tagcounts (csv): dataframe containing the calculated counts per file per keyword
@@ -1275,21 +1324,22 @@ def tag_folder_weighted(input_path: str, outputCSV: str = "output/csv/keywords.c
     guarantee_csv_exists(outputCSV, df)
 
     outputfile = pd.read_csv(outputCSV, sep = separator)["file"].tolist()
-    itemlist = list_filenames(input_path, "*.txt")
+    itemlist = [item for item in list_filenames(input_path, "*.txt") if str(item) not in outputfile]
+    files = [f"{input_path}/{item}.txt" for item in itemlist]
+    keylist = construct_keylist(keylist_path, alternate_lists)
+    tag_function = partial(tag_file_weighted, alternate_lists=alternate_lists, treshold=treshold, keylist=keylist)
     taglists = []
 
-    for item in itemlist:
-        file_path = f"{input_path}/{item}.txt"
-        if str(item) not in outputfile:
-            text_keylist = list(tag_file_weighted(file_path, keylist_path, alternate_lists, treshold).keys())
+    for item, tags in zip(itemlist, _map_files(tag_function, files, processes)):
+        text_keylist = list(tags.keys())
             
-            taglists.append(text_keylist) 
+        taglists.append(text_keylist) 
 
-            # create pandas row
-            dfcolumn = pd.DataFrame(
-            {"file": str(item), "keywords": str(text_keylist)}, index=[0])
-            dfcolumn.to_csv(outputCSV, mode="a", index=False, header=False, sep = separator)
-            print("tagged", str(item))
+        # create pandas row
+        dfcolumn = pd.DataFrame(
+        {"file": str(item), "keywords": str(text_keylist)}, index=[0])
+        dfcolumn.to_csv(outputCSV, mode="a", index=False, header=False, sep = separator)
+        print("tagged", str(item))
     
     print("finished writing tags to keywords.csv")
     tagcounts = calculate_tag_counts(taglists)
@@ -1312,7 +1362,7 @@ def write_bib(output_csv_file: str = "output/csv/keywords.csv", libtex_csv: str
     
     bibfolder (str): A filepath to the directory where the updated .bib file should be saved.
     
-    CSVtotal (str): A filepath to the directory where the merged CSV file should be saved.
+    CSVtotal (str): A filepath to the directory where the merged CSV file should be saved. Use a .parquet extension to store it as parquet instead.
 
     separator (str): The separator to use as csv delimiter. Defaults to ",".
 
@@ -1336,10 +1386,10 @@ def write_bib(output_csv_file: str = "output/csv/keywords.csv", libtex_csv: str
                 filenpath_lookup = entry["file"].split("\\\\")[-1]
                 filename_item = filenpath_lookup.split(".pdf")[0]
                 lookup_raw = keyframe.loc[keyframe["file"] == filename_item]["keywords"]
-                keyword_lookup = " ".join(lookup_raw).replace("'", "").replace("[", "").replace("]", "").split(", ")
+                keyword_lookup = " ".join(lookup_raw).translate(list_markup_table).split(", ")
                 bib_keywords = str(entry.get("keywords", "")).split(", ") if entry.get("keywords", "") else []
                 combined_keywords = bib_keywords + keyword_lookup
-                entry["keywords"] = ", ".join(set(combined_keywords)).replace("'", "").replace("[", "").replace("]", "").replace("\\", "").replace("{", "").replace("}", "")
+                entry["keywords"] = ", ".join(set(combined_keywords)).translate(keyword_markup_table)
                 row = {'file': filename_item, 'title': title_lookup, 'keywords': entry["keywords"]}
                 join_dict.append(row)
 
@@ -1354,13 +1404,13 @@ def write_bib(output_csv_file: str = "output/csv/keywords.csv", libtex_csv: str
                 str(row["keywords_x"]).split(", ") if row["keywords_x"] else [] + 
                 str(row["keywords_y"]).split(", ")
             )
-        ).replace("'", "").replace("[", "").replace("]", "").replace("\\", "").replace("{", "").replace("}", ""),
+        ).translate(keyword_markup_table),
         axis=1
     )
 
     del totalframe["keywords_x"]
     del totalframe["keywords_y"]
-    totalframe.to_csv(CSVtotal, index=False, sep=separator)
+    write_table(totalframe, CSVtotal, separator)
     return
 
 
@@ -1391,7 +1441,7 @@ def write_article_summaries(CSVtotal: str="output/csv/total.csv", Article_templa
     Note: The function uses several string manipulation functions to clean and format text data.
     """
     print("creating article summaries")
-    dataframe = pd.read_csv(CSVtotal, sep=separator)
+    dataframe = read_table(CSVtotal, separator)
     with open(Article_template, "r") as f:
         template_text = f.read()
     placeholderlist = [
@@ -1428,10 +1478,10 @@ def write_article_summaries(CSVtotal: str="output/csv/total.csv", Article_templa
     for index, row in dataframe.iterrows():
         if str(row[title_column]) != "nan":
             # Create file with title as name
-            title = str(row[title_column])
-            illegal_chars = [":", ";", "=", ".", "{", "}", "?", ",", "\\", "/", "*", '"', "'", "textgreater", "textbackslash", "textlessI", "textlessspan"]
-            for char in illegal_chars:
-                title = title.replace(char, "_")
+            title = str(row[title_column]).translate(filename_table)
+            illegal_words = ["textgreater", "textbackslash", "textlessI", "textlessspan"]
+            for word in illegal_words:
+                title = title.replace(word, "_")
             name = title
             fullname = mdFolder + "/papers/Note " + name + ".md"
             value = check_record_type(row)
@@ -1471,7 +1521,7 @@ def write_author_summaries(CSVtotal: str = "output/csv/total.csv", Author_templa
     """
     print("Creating author summaries")
     
-    dataframe = pd.read_csv(CSVtotal, sep=separator)
+    dataframe = read_table(CSVtotal, separator)
     template_text = open(Author_template, "r").read()
     
     authorlist = []
@@ -1520,7 +1570,7 @@ def write_journal_summaries(CSVtotal: str = "output/csv/total.csv", Journal_temp
     """
     print("Creating journal summaries")
     
-    dataframe = pd.read_csv(CSVtotal, sep=separator)
+    dataframe = read_table(CSVtotal, separator)
     template_text = open(Journal_template, "r").read()
 
     for index, row in dataframe.iterrows():
@@ -1538,7 +1588,7 @@ def write_journal_summaries(CSVtotal: str = "output/csv/total.csv", Journal_temp
 
 
 ### main workflows
-def prepare_input(source_folder="", PDFfolder="input/pdf", TXTfolder="input/pdf/docs", TXTCorfolder="input/pdf/docs/corrected") -> None:
+def prepare_input(source_folder="", PDFfolder="input/pdf", TXTfolder="input/pdf/docs", TXTCorfolder="input/pdf/docs/corrected", use_pdftotext=False, processes=None) -> None:
     """
     Collects pdf files from given folder and subfolders, converts them to txt and cleans unicode decoding errors.
 
@@ -1552,12 +1602,16 @@ def prepare_input(source_folder="", PDFfolder="input/pdf", TXTfolder="input/pdf/
     
     TXTCorfolder (str): Path to the folder in which to store the unicode corrected txt files.
 
+    use_pdftotext (bool): Extract text with poppler's pdftotext when it is installed instead of PyPDF2.
+
+    processes (int): Maximum number of simultaneous pdftotext conversions. Defaults to the number of cpu cores.
+
     Return:
     -----------
     None
     """
     collect_PDF_files(source_folder, PDFfolder)
-    pdf2txtfolder(PDFfolder, TXTfolder)
+    pdf2txtfolder(PDFfolder, TXTfolder, use_pdftotext, processes)
     unicodecleanup_folder(TXTfolder, TXTCorfolder)
     return
 
@@ -1576,7 +1630,7 @@ def create_summaries(mdFolder: str="output/md", Article_template: str="input/tem
 
     Journal_template (str): Path to the template for the journal .md files.
     
-    CSVtotal (str): Path to the file in which to store the .csv output.
+    CSVtotal (str): Path to the file in which to store the .csv output. Use a .parquet extension to store it as parquet instead.
 
     Author_column (str): Column containing the author names in the input csv.
 
@@ -1595,7 +1649,7 @@ def create_summaries(mdFolder: str="output/md", Article_template: str="input/tem
 
 
 ### complete tagging routine
-def automated_pdf_tagging(source_folder:str="", PDFfolder:str="input/pdf", TXTfolder:str="input/pdf/docs", TXTCorfolder:str="input/pdf/docs/corrected", keylist_path:str="input/keylist.csv", outputCSV:str="output/csv/keywords.csv", libtex_csv:str="input/savedrecs.csv", bibfile:str="", bibfolder:str="output/bib", CSVtotal:str="output/csv/total.csv", mdFolder:str="output/md", Article_template:str="input/templates/Paper.md", Author_template:str="input/templates/Author.md", Journal_template:str="input/templates/Journal.md", alternate_lists:str="none", weighted:bool= False, treshold:int = 2, summaries:bool = False, separator:str = ",", author_column: str = "Authors", title_column: str = "Title") -> None:
+def automated_pdf_tagging(source_folder:str="", PDFfolder:str="input/pdf", TXTfolder:str="input/pdf/docs", TXTCorfolder:str="input/pdf/docs/corrected", keylist_path:str="input/keylist.csv", outputCSV:str="output/csv/keywords.csv", libtex_csv:str="input/savedrecs.csv", bibfile:str="", bibfolder:str="output/bib", CSVtotal:str="output/csv/total.csv", mdFolder:str="output/md", Article_template:str="input/templates/Paper.md", Author_template:str="input/templates/Author.md", Journal_template:str="input/templates/Journal.md", alternate_lists:str="none", weighted:bool= False, treshold:int = 2, summaries:bool = False, separator:str = ",", author_column: str = "Authors", title_column: str = "Title", processes:int = 1, use_pdftotext:bool = False) -> None:
     """
     Complete workflow for pdf tagging. Define 1) the reference manager path containing all pdf files and 2) the path to the .bib file, 3) the alternative taglist to include (defaults to "none").
 
@@ -1619,7 +1673,7 @@ def automated_pdf_tagging(source_folder:str="", PDFfolder:str="input/pdf", TXTfo
 
     bibfolder (str): Path to the folder in which to store the .bib ouput.
 
-    CSVtotal (str): Path to the file in which to store the .csv output.
+    CSVtotal (str): Path to the file in which to store the .csv output. Use a .parquet extension to store it as parquet instead.
 
     mdFolder (str): Path to the folder in which to store the .md output.
 
@@ -1637,18 +1691,22 @@ def automated_pdf_tagging(source_folder:str="", PDFfolder:str="input/pdf", TXTfo
 
     summaries (bool): Indicates whether markdown summaries per article, author and journal should be generated.
 
+    processes (int): Number of worker processes used to tag files in parallel, and of simultaneous pdftotext conversions when use_pdftotext is set. Default is 1 (no parallelism).
+
+    use_pdftotext (bool): Extract text with poppler's pdftotext when it is installed instead of PyPDF2.
+
     Return:
     -----------
     None
     """    
-    prepare_input(source_folder, PDFfolder, TXTfolder, TXTCorfolder)
+    prepare_input(source_folder, PDFfolder, TXTfolder, TXTCorfolder, use_pdftotext, processes)
     guarantee_folder_exists("output/bib")
     guarantee_folder_exists("output/csv")
     guarantee_folder_exists("output/md")
     if weighted == True:
-        tag_folder_weighted(input_path = TXTCorfolder, keylist_path = keylist_path, alternate_lists = alternate_lists, treshold = 2, separator = separator)
+        tag_folder_weighted(input_path = TXTCorfolder, keylist_path = keylist_path, alternate_lists = alternate_lists, treshold = 2, separator = separator, processes = processes)
     else:
-        tag_folder(TXTCorfolder, keylist_path, outputCSV, alternate_lists, separator)
+        tag_folder(TXTCorfolder, keylist_path, outputCSV, alternate_lists, separator, processes = processes)
     write_bib(outputCSV, libtex_csv, bibfile, bibfolder, CSVtotal, separator)
     if summaries == True:
         create_summaries(mdFolder = mdFolder, Article_template = Article_template, Author_template = Author_template, Journal_template = Journal_template, CSVtotal = CSVtotal, separator = separator, author_column = author_column, title_column = title_column)
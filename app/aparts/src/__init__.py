@@ -1,11 +1,11 @@
-from .APT import (author_to_firstname_lastname, automated_pdf_tagging, check_record_type, calculate_tag_counts, collapse_authors, collect_PDF_files, construct_keylist, convert_unicode_from_string, correct_authornames, create_summaries, filter_uniques_from_list, find_keywords, fix_broken_words, get_filename, guarantee_csv_exists, guarantee_folder_exists, guarantee_md_output_folders_exist, list_filenames, merge_sourcefolder_to_distfolder, pdf2txtfolder, populate_placeholders, populate_with_template, prepare_input, preprocess_text, remove_special_characters, remove_trailing_backslashes, reset_eof_of_pdf_return_stream, set_additional_keywords, sort_joined_list, tag_csv, tag_file_weighted, tag_folder, tag_folder_weighted, unicodecleanup_folder, write_article_summaries, write_author_summaries, write_bib, write_journal_summaries)
+from .APT import (author_to_firstname_lastname, automated_pdf_tagging, check_record_type, calculate_tag_counts, collapse_authors, collect_PDF_files, construct_keylist, convert_unicode_from_string, correct_authornames, create_summaries, extract_pages_pdftotext, extract_pages_pypdf, filter_uniques_from_list, find_keywords, fix_broken_words, get_filename, guarantee_csv_exists, guarantee_folder_exists, guarantee_md_output_folders_exist, list_filenames, merge_sourcefolder_to_distfolder, pdf2txtfolder, populate_placeholders, populate_with_template, prepare_input, preprocess_text, read_table, remove_special_characters, remove_trailing_backslashes, reset_eof_of_pdf_return_stream, set_additional_keywords, sort_joined_list, tag_csv, tag_file, tag_file_weighted, tag_folder, tag_folder_weighted, unicodecleanup_folder, write_article_summaries, write_author_summaries, write_bib, write_journal_summaries, write_table)
 from .construct_keylist import (bigram_extraction, clean_keywords, construct_keylist, do_clean, extract_tags, generate_folder_structure, generate_keylist, get_original_keywords, guarantee_folder_exists, import_bib, keybert_extraction,  rake_extraction,  textrank_calculation, visualize_textrank_graph, textrank_extraction, topicrank_calculation, topicrank_extraction, tf_idf_extraction, yake_extraction)
-from .download_pdf import (get_article, get_article_by_author, get_author_bibliography, get_author_metadata, get_author_publications, get_first_article, lookup_author, scihub_download, scihub_download_pdf)
+from .download_pdf import (get_article, get_article_by_author, get_author_bibliography, get_author_metadata, get_author_publications, get_first_article, lookup_author, scihub_download, scihub_download_pdf, scihub_download_pdfs)
 from .extract_references import (extract_references_from_file)
 #from .scholar_record_extraction import (download_articles, rotate_proxy)
-from .weighted_tagging import (clean_end_section, count_keyword_occurrences, denest_and_order_dict, extract_sections, filter_values, listdir,  nested_dict_to_dataframe, open_file, prepare_bytes_for_pattern, print_nested_dict, save_dataframe, split_text_to_sections)
-from .graph import (collect_data_from_csv, create_network_lists, file_name_to_title, find_value_and_delete_upper_level_entry, flatten_nested_dict_value_to_list, graph_view, link_from_file, link_from_folder, link_items_to_source, parse_data_from_csv, remove_dead_links_from_reference_dict, replace_filenames_by_title)
-from .summarization import (generate_sentence_tokens, remove_repeating_sentences, summarize_file, summarize_text, summarize_tokens)
+from .weighted_tagging import (clean_end_section, count_keyword_occurrences, denest_and_order_dict, extract_sections, filter_values, listdir,  nested_dict_to_dataframe, open_file, prepare_bytes_for_pattern, print_nested_dict, read_file, save_dataframe, split_text_to_sections)
+from .graph import (collect_data_from_csv, create_network_lists, file_name_to_title, find_value_and_delete_upper_level_entry, find_values_and_delete_upper_level_entries, flatten_nested_dict_value_to_list, graph_view, link_from_file, link_from_folder, link_items_to_source, parse_data_from_csv, remove_dead_links_from_reference_dict, replace_filenames_by_title)
+from .summarization import (generate_sentence_tokens, load_language_model, remove_repeating_sentences, summarize_file, summarize_text, summarize_tokens)
 from .subsampling import (generate_binary_item_matrix, generate_bray_curtis_dissimilarity, calculate_euclidean_distance_matrix, select_items_by_distance, get_selected_coordinates, get_sample_id, subsample_from_csv, plot_array, transform_dataframe, assign_group)
 from .deduplication import (count_tag_occurrence, plot_pca_tags, deduplicate_tag_conjugations, retrieve_pca_components, drop_0_columns, deduplicate_dataframe, group_tags_by_dissimilarity, retrieve_clusters, drop_unique_columns, merge_similar_tags_from_dataframe, generate_tag_dissimilarity, )
 from .semantic_scholar import(batch_collect_author_metadata, batch_collect_paper_metadata, batch_collect_recommendation_metadata, dict_to_csv, fetch_authors_semantic_scholar, fetch_metadata_semantic_scholar, fetch_recommendations_semantic_scholar, fetch_query_semantic_scholar, json_author_to_dict, json_paper_to_dict, json_recommendation_to_dict, query_to_csv)
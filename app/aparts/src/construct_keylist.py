@@ -1,5 +1,6 @@
 import os
 import re
+from collections import Counter
 from operator import itemgetter
 
 import gensim
@@ -11,18 +12,18 @@ import pandas as pd
 from anyascii import anyascii
 from cleantext import clean
 from fuzzywuzzy import fuzz
-from gensim import models
 from gensim.parsing.preprocessing import remove_stopwords, strip_short
 from gensim.utils import simple_preprocess
 from keybert import KeyBERT
 from nlp_rake import Rake
+from nlp_rake.utils import separate_words
 from nltk.corpus import stopwords
 from nltk.stem import PorterStemmer
 from nltk.tokenize import sent_tokenize
 from pybtex.database import parse_file
 from pybtex.database.input import bibtex
 from six import iteritems
-from spacy import load
+from sklearn.feature_extraction.text import TfidfVectorizer
 from yake import KeywordExtractor
 
 """ aparts
@@ -40,6 +41,22 @@ taglist = []
 scorelist = []
 
 
+class PhraseCountingRake(Rake):
+    """
+    RAKE extractor that counts candidate phrases in a single pass.
+
+    The phrase candidates are still obtained by splitting sentences on stopwords and delimiters, but the minimum frequency 
+    check uses one Counter over all phrases instead of counting the full phrase list again for every phrase.
+    """
+    def _generate_candidate_keyword_scores(self, phrase_list: list, word_score: dict) -> dict:
+        keyword_candidates = {}
+        for phrase, count in Counter(phrase_list).items():
+            if count >= self.min_freq:
+                keyword_candidates[phrase] = sum(
+                    word_score[word] for word in separate_words(phrase))
+        return keyword_candidates
+
+
 def guarantee_folder_exists(folder: str) -> None:
     """Create folder if not yet present."""
     if not os.path.exists(folder):
@@ -293,7 +310,7 @@ def rake_extraction(records: str, WOScolumn: str, name: str, Rake_stoppath: str,
     -----------
     None
     """
-    rake = Rake(
+    rake = PhraseCountingRake(
         min_chars=3,
         max_words=3,
         min_freq=2,
@@ -409,7 +426,6 @@ def textrank_extraction(records: str, WOScolumn: str, name: str, amount: int, in
         print("generating textrank tags from abstracts")
     elif name == "wos_t":
         print("generating textrank tags from titles")
-    nlp = load("en_core_web_sm")
     data = pd.read_csv(records, sep = separator)[WOScolumn].tolist()
     data = str(data).encode(encoding="unicode_escape")
     data = remove_stopwords(data)
@@ -418,7 +434,6 @@ def textrank_extraction(records: str, WOScolumn: str, name: str, amount: int, in
     text = do_clean(text)
     text = text.replace("[", "").replace("]", "").replace(
         "{", "").replace("}", "").replace("<", "").replace(">", "").replace("%", "")
-    nlp.max_length = len(text) + 100
     keyphrases = textrank_calculation(text, amount, 1, False)
     keyphrases.to_csv(f"{input_folder}/TextR_{name}.csv", index=False)
     return
@@ -468,8 +483,6 @@ def topicrank_extraction(records: str, WOScolumn: str, name: str, amount: int, i
         print("generating topicrank tags from abstracts")
     elif name == "wos_t":
         print("generating topicrank tags from titles")
-    nlp = load("en_core_web_sm")
-    nlp.max_length = 1500000
     data = pd.read_csv(records, sep = separator)[WOScolumn].tolist()
     data = str(data).encode(encoding="unicode_escape")
     data = remove_stopwords(data)
@@ -487,6 +500,8 @@ def tf_idf_extraction(records: str, WOScolumn: str, name: str, input_folder: str
     """
     Determine keywords from the given column for each entry in a csv file using the TF-IDF algorithm. 
 
+    Every record is weighted as its own document, after which the weights of each term are summed over all records. Terms used throughout the records thereby rank above terms that are prominent in a single record.
+
     Parameters:
     -----------
     records (str): Path to the csv containing the Web of Science records.
@@ -503,35 +518,34 @@ def tf_idf_extraction(records: str, WOScolumn: str, name: str, input_folder: str
         print("generating tf_idf tags from abstracts")
     elif name == "wos_t":
         print("generating tf_idf tags from titles")
-    data = pd.read_csv(records, sep = separator)[WOScolumn].tolist()
-    data = str(data).encode(encoding="unicode_escape")
-    data = remove_stopwords(data)
-    doc = strip_short(data)
-    doc = do_clean(doc)
-    doc = doc.replace("[", "").replace("]", "").replace("{", "").replace(
-        "}", "").replace("<", "").replace(">", "").replace("%", "")
-    doc = list(pd.Series(data))
-
-    text_tokens = [[tok for tok in doc.split(",")] for doc in doc]
-    mydict = corpora.Dictionary([simple_preprocess(line) for line in doc])
-    corpus = [mydict.doc2bow(simple_preprocess(line)) for line in doc]
-
-    tfidf = models.TfidfModel(corpus, smartirs="ntc")
-    for doc in tfidf[corpus]:
-        locals()["data_{0}".format(doc)] = pd.DataFrame(
-            data=[[mydict[id], np.around(freq, decimals=2)]
-                  for id, freq in doc],
-            columns=["ID", "frequency"],
-        )
-        locals()["data_{0}".format(doc)] = locals()["data_{0}".format(doc)].sort_values(
-            by="frequency", ascending=False
-        )
-        locals()["data_{0}".format(doc)] = locals()["data_{0}".format(doc)][
-            locals()["data_{0}".format(doc)]["frequency"] > 0.01
-        ]
-        locals()["data_{0}".format(doc)].to_csv(
-            f"{input_folder}/tf-idf_{name}.csv", index=False
-        )
+    # records without a title or abstract would otherwise become a document reading "nan"
+    data = pd.read_csv(records, sep = separator)[WOScolumn].dropna().tolist()
+    documents = []
+    for record in data:
+        record = str(record).encode(encoding="unicode_escape")
+        record = remove_stopwords(record)
+        doc = strip_short(record)
+        doc = do_clean(doc)
+        doc = doc.replace("[", "").replace("]", "").replace("{", "").replace(
+            "}", "").replace("<", "").replace(">", "").replace("%", "")
+        documents.append(doc)
+
+    # one document per record, weighted by raw term counts, the unsmoothed idf ln(N/df) + 1 and cosine normalization.
+    # This differs from gensim's "ntc" scheme, which uses log2(N/df) as idf
+    vectorizer = TfidfVectorizer(analyzer=simple_preprocess, smooth_idf=False, norm="l2")
+    try:
+        tfidf = vectorizer.fit_transform(documents)
+    except ValueError:
+        # no terms are left after cleaning, so there are no tags to weigh
+        pd.DataFrame(columns=["ID", "frequency"]).to_csv(f"{input_folder}/tf-idf_{name}.csv", index=False)
+        return
+    # the summed weights are cosine normalized once more, so they share the scale of the weights of a single record
+    scores = np.asarray(tfidf.sum(axis=0)).ravel()
+    scores = scores / np.linalg.norm(scores)
+    keywords = pd.DataFrame({"ID": vectorizer.get_feature_names_out(), "frequency": np.around(scores, decimals=2)})
+    keywords = keywords.sort_values(by="frequency", ascending=False)
+    keywords = keywords[keywords["frequency"] > 0.01]
+    keywords.to_csv(f"{input_folder}/tf-idf_{name}.csv", index=False)
     return
 
 
@@ -1,24 +1,32 @@
 import os
-from itertools import combinations, cycle
+from bisect import bisect_left
+from itertools import chain, combinations, cycle
 from math import sqrt, ceil
+from typing import Union
 
 import matplotlib
 import matplotlib.cm as cm
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from sklearn.cluster import AgglomerativeClustering, KMeans
-from sklearn.decomposition import PCA
+from scipy.cluster import hierarchy
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial.distance import squareform
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.decomposition import PCA, IncrementalPCA
 from sklearn.metrics import pairwise_distances
 from sklearn.preprocessing import StandardScaler
 
-from aparts.src.subsampling import (assign_group, generate_binary_item_matrix,
+from aparts.src.subsampling import (NUMBA_AVAILABLE, assign_group,
+                                    generate_binary_item_matrix, is_binary,
+                                    pack_rows, packed_bray_curtis,
                                     transform_dataframe)
 
 matplotlib.use('TkAgg')
 
 
-def group_tags_by_dissimilarity(dissimilarity_matrix: np.ndarray, tag_names: list, threshold: float = 0.5, print_output: bool = False) -> list:
+def group_tags_by_dissimilarity(dissimilarity_matrix: np.ndarray, tag_names: list, threshold: float = 0.5, print_output: bool = False, linkage: str = "average") -> list:
     """
     Group tags based on dissimilarity using Agglomerative Clustering.
 
@@ -32,32 +40,39 @@ def group_tags_by_dissimilarity(dissimilarity_matrix: np.ndarray, tag_names: lis
 
     print_output (bool, optional): Flag to print additional output. Default is False.
 
+    linkage (str, optional): Linkage criterion accepted by scipy.cluster.hierarchy.linkage, such as "average", "complete" or "single". Single linkage is resolved as the connected components of all tag pairs below the threshold. Default is "average".
+
     Return:
     -----------
     nnamed_groups (list): List of groups, where each group is a list of tag names with low dissimilarity.
     """
-    clustering = AgglomerativeClustering(
-        n_clusters=None, linkage='average', distance_threshold=threshold, metric='precomputed')
-    clusters = clustering.fit_predict(dissimilarity_matrix)
+    if linkage == "single":
+        adjacency = csr_matrix(dissimilarity_matrix < threshold)
+        clusters = connected_components(adjacency, directed=False)[1]
+    else:
+        # the linkage works on the condensed upper triangle, half the size of the square matrix
+        condensed = squareform(dissimilarity_matrix, checks=False)
+        linkage_matrix = hierarchy.linkage(condensed, method=linkage)
+        # only merges strictly below the threshold join a cluster, whereas fcluster also keeps merges at the threshold
+        clusters = hierarchy.fcluster(linkage_matrix, t=np.nextafter(threshold, -np.inf), criterion='distance')
 
-    grouped_columns = {}
-    for col_idx, cluster_id in enumerate(clusters):
-        if cluster_id not in grouped_columns:
-            grouped_columns[cluster_id] = []
-        grouped_columns[cluster_id].append(col_idx)
+    # a stable sort lists the columns of every cluster in their original order
+    order = np.argsort(clusters, kind='stable')
+    boundaries = np.flatnonzero(np.diff(clusters[order])) + 1
+    grouped_columns = np.split(order, boundaries)
 
-    # Filter clusters to include only those with 2 or more items
-    filtered_groups = [
-        group for group in grouped_columns.values() if len(group) >= 2]
+    # Filter clusters to include only those with 2 or more items, in order of their first tag
+    filtered_groups = sorted(
+        (group for group in grouped_columns if len(group) >= 2), key=lambda group: group[0])
 
     # Substitute indices with tag names
-    nnamed_groups = [[tag_names[col_idx] for col_idx in group]
-                     for group in filtered_groups]
+    tag_names = np.asarray(tag_names, dtype=object)
+    nnamed_groups = [tag_names[group].tolist() for group in filtered_groups]
 
     return nnamed_groups
 
 
-def generate_tag_dissimilarity(dataframe: pd.DataFrame) -> np.ndarray:
+def generate_tag_dissimilarity(dataframe: pd.DataFrame, dtype: np.dtype = np.float64) -> np.ndarray:
     """
     Generate a dissimilarity matrix for tags based on binary presence/absence in a DataFrame.
 
@@ -65,14 +80,30 @@ def generate_tag_dissimilarity(dataframe: pd.DataFrame) -> np.ndarray:
     -----------
     dataframe (pd.DataFrame): DataFrame containing binary information for tag presence/absence.
 
+    dtype (np.dtype, optional): Floating point precision of the dissimilarity matrix. Default is float64, as binary dissimilarities are exact ratios that float32 rounding can move across the grouping threshold.
+
     Return:
     -----------
     np.ndarray: Dissimilarity matrix calculated using Bray-Curtis distance.
     """
-    binary_dataframe = dataframe.astype(int)
-    matrix = binary_dataframe.values
-    dissimilarity_matrix = pairwise_distances(matrix.T, metric='braycurtis')
-    return dissimilarity_matrix
+    values = dataframe.to_numpy()
+    binary = is_binary(values)
+    if NUMBA_AVAILABLE and binary:
+        # packbits takes boolean and integer tags as they are, so the tags go to bits without a dense floating point copy
+        tags = values.T if values.dtype.kind in "biu" else values.T != 0
+        dissimilarity_matrix = packed_bray_curtis(pack_rows(tags))
+    elif binary:
+        matrix = values.astype(dtype, copy=False)
+        # for presence/absence data bray-curtis reduces to (|a| + |b| - 2|a & b|) / (|a| + |b|), with all intersections from one matrix product
+        tag_counts = matrix.sum(axis=0)
+        shared = matrix.T @ matrix
+        totals = tag_counts[:, None] + tag_counts[None, :]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            dissimilarity_matrix = (totals - 2 * shared) / totals
+        np.fill_diagonal(dissimilarity_matrix, 0)
+    else:
+        dissimilarity_matrix = pairwise_distances(values.T.astype(dtype, copy=False), metric='braycurtis')
+    return dissimilarity_matrix.astype(dtype, copy=False)
 
 
 def deduplicate_tag_conjugations(word_list: list, method: str = "", deleted_pairs: list = None) -> list:
@@ -99,28 +130,42 @@ def deduplicate_tag_conjugations(word_list: list, method: str = "", deleted_pair
     if deleted_pairs is None:
         deleted_pairs = []
 
-    sorted_words = sorted(word_list, key=len, reverse=True)
-    processed_prefixes = set()
-    deduplicated = []
-
-    for word in sorted_words:
-        pair = ()
-        if isinstance(word, list):
-            deduplicated_sublist = deduplicate_tag_conjugations(
-                word, method, deleted_pairs)
-            deduplicated.append(deduplicated_sublist)
-        elif isinstance(word, str):
-            is_duplicate = any(word.startswith(
-                existing_prefix[:len(word)]) for existing_prefix in processed_prefixes)
-            if is_duplicate:
-                pair = (word, next(existing_prefix for existing_prefix in processed_prefixes if word.startswith(
-                    existing_prefix[:len(word)])))
-                deleted_pairs.append(pair)
-            else:
-                deduplicated.append(word)
-                processed_prefixes.add(word)
+    def open_group(words: list) -> tuple:
+        "Return an iterator over the words of a group longest first, the stems they reduce to, the words to keep and the list collecting the kept words"
+        # words are visited longest first, so a word is a conjugation when it is the prefix of a longer (or identical) word.
+        # After a lexicographic sort those words directly follow it, so the kept words are found in a single pass
+        unique_words = sorted({word for word in words if isinstance(word, str)})
+        processed_prefixes = [word for word, next_word in zip(unique_words, unique_words[1:] + [None])
+                              if next_word is None or not next_word.startswith(word)]
+        return iter(sorted(words, key=len, reverse=True)), processed_prefixes, set(processed_prefixes), []
+
+    # sublists are handled depth first on an explicit stack, in the order a recursive call would visit them
+    root_group = open_group(word_list)
+    stack = [root_group]
+    while stack:
+        sorted_words, processed_prefixes, kept_words, deduplicated = stack[-1]
+        for word in sorted_words:
+            if isinstance(word, list):
+                sublist_group = open_group(word)
+                deduplicated.append(sublist_group[3])
+                stack.append(sublist_group)
+                break
+            elif isinstance(word, str):
+                if word in kept_words:
+                    deduplicated.append(word)
+                    # any repetition is a duplicate of this first occurrence
+                    kept_words.discard(word)
+                else:
+                    # the first kept word at or after the prefix holds the stem, so out of several kept words extending it the
+                    # lexicographically first one is chosen
+                    stem = processed_prefixes[bisect_left(processed_prefixes, word)]
+                    pair = (word, stem)
+                    deleted_pairs.append(pair)
+        else:
+            # all words of the group are processed, resume its parent
+            stack.pop()
 
-    return deleted_pairs if method == "pairs" else deduplicated
+    return deleted_pairs if method == "pairs" else root_group[3]
 
 
 def deduplicate_dataframe(dataframe: pd.DataFrame, pairs_list: list, mode: str = "strict") -> pd.DataFrame:
@@ -140,32 +185,40 @@ def deduplicate_dataframe(dataframe: pd.DataFrame, pairs_list: list, mode: str =
     --------
     pd.DataFrame: The deduplicated DataFrame.
     """
-    deduplicated_dataframe = dataframe.copy()
+    # collect merged sinks and dropped sources first, so the frame is only rebuilt once
+    columns = set(dataframe.columns)
+    updated_columns = {}
+    dropped_columns = {}
 
     for pair in pairs_list:
         source, sink = pair
 
-        if source not in deduplicated_dataframe.columns or sink not in deduplicated_dataframe.columns:
+        if source not in columns or sink not in columns:
             continue
 
-        sourcedata = deduplicated_dataframe[source]
-        sinkdata = deduplicated_dataframe[sink]
+        sourcedata = updated_columns.get(source, dataframe[source])
+        sinkdata = updated_columns.get(sink, dataframe[sink])
 
         if mode == "strict":
-            for i in range(len(sourcedata)):
-                if sourcedata[i] > 0:
-                    sinkdata[i] = sourcedata[i]
-            deduplicated_dataframe[sink] = sinkdata
-            deduplicated_dataframe.drop(columns=[source], inplace=True)
+            sinkdata = sinkdata.mask(sourcedata > 0, sourcedata)
+            updated_columns[sink] = sinkdata
+            columns.discard(source)
+            dropped_columns[source] = None
 
         if mode == "lenient":
             if sourcedata.equals(sinkdata):
-                deduplicated_dataframe.drop(columns=[source], inplace=True)
+                columns.discard(source)
+                dropped_columns[source] = None
+
+    deduplicated_dataframe = dataframe.drop(columns=list(dropped_columns))
+    for column, data in updated_columns.items():
+        if column in columns:
+            deduplicated_dataframe[column] = data
 
     return deduplicated_dataframe
 
 
-def merge_similar_tags_from_dataframe(input_file: str, output: str, variables: str, id: str, tag_length: int,  number_of_records: int = "", threshold: float = 0.6, manual: bool = False, show_output: bool = False):
+def merge_similar_tags_from_dataframe(input_file: str, output: str, variables: str, id: str, tag_length: int,  number_of_records: int = "", threshold: float = 0.6, manual: bool = False, show_output: bool = False, linkage: str = "average"):
     """
     Merges similar tags in a DataFrame based on tag similarity using various deduplication methods.
 
@@ -189,6 +242,8 @@ def merge_similar_tags_from_dataframe(input_file: str, output: str, variables: s
 
     show_output (bool): Whether to display intermediate output. Default is False.
 
+    linkage (str): Linkage criterion used to group similar tags, any method accepted by group_tags_by_dissimilarity such as "average", "complete" or "single". Default is "average".
+
     Returns:
     --------
     pd.DataFrame: DataFrame with similar tags merged using the specified deduplication methods.
@@ -197,14 +252,7 @@ def merge_similar_tags_from_dataframe(input_file: str, output: str, variables: s
         """
         Generate all possible combinations of tag pairs from a nested list of tags.
         """
-        combination = []
-
-        for item in nested_list:
-            product = []
-            product = list(combinations(item, 2))
-            combination.extend(product)
-
-        return combination
+        return list(chain.from_iterable(combinations(item, 2) for item in nested_list))
 
     def calculate_tag_similarity(Dataframe: pd.DataFrame, method: str, treshold: float) -> tuple[list, np.ndarray]:
         """
@@ -213,7 +261,7 @@ def merge_similar_tags_from_dataframe(input_file: str, output: str, variables: s
         tag_dissimilarity = generate_tag_dissimilarity(Dataframe)
         tag_names = Dataframe.columns
         grouped_tags = group_tags_by_dissimilarity(
-            tag_dissimilarity, tag_names, treshold)
+            tag_dissimilarity, tag_names, treshold, linkage=linkage)
         deduplicated_tags = deduplicate_tag_conjugations(grouped_tags, method)
 
         return deduplicated_tags, tag_dissimilarity
@@ -294,23 +342,19 @@ def count_tag_occurrence(dataframe: pd.DataFrame) -> np.array:
     np.array: Array of tuples containing tag names and their corresponding occurrence counts.
     """
     # Assuming the binary columns start from column index 1
-    binary_columns = dataframe.columns[1:]
-
-    counts = []
-    for column in binary_columns:
-        count = dataframe[column].sum()
-        if count > 0:
-            counts.append((column, count))
-    counts.sort(key=lambda x: x[1], reverse=True)
-    return counts
+    counts = dataframe.iloc[:, 1:].sum(axis=0)
+    # a stable sort keeps tags with equal counts in column order
+    counts = counts[counts > 0].sort_values(ascending=False, kind="stable")
+    return list(counts.items())
 
 
 def drop_0_columns(dataframe: pd.DataFrame) -> pd.DataFrame:
     """
     Delete any columns without observations from the given dataframe.
     """
-    zero_columns = dataframe.columns[(dataframe == 0).all()]
-    dataframe.drop(zero_columns, axis=1, inplace=True)
+    # any() reduces the values directly, without materializing a comparison matrix first
+    has_observations = dataframe.to_numpy().any(axis=0)
+    dataframe.drop(dataframe.columns[~has_observations], axis=1, inplace=True)
     return dataframe
 
 
@@ -318,15 +362,13 @@ def drop_unique_columns(Dataframe: pd.DataFrame) -> pd.DataFrame:
     """
     Drop all single observation columns from a dataframe    
     """
-    filtered_dataframe = Dataframe.copy()
-    counts = count_tag_occurrence(Dataframe)
-    for item, count in counts:
-        if count == 1:
-            filtered_dataframe.drop(columns=[item], inplace=True)
+    # Assuming the binary columns start from column index 1, as in count_tag_occurrence
+    counts = Dataframe.iloc[:, 1:].sum(axis=0)
+    filtered_dataframe = Dataframe.drop(columns=counts.index[counts == 1])
     return filtered_dataframe
 
 
-def plot_pca_tags(data: pd.DataFrame, n_components_for_variance: int = 0, show_plots: str = "") -> tuple[list[str], PCA, int]:
+def plot_pca_tags(data: pd.DataFrame, n_components_for_variance: int = 0, show_plots: str = "", incremental_threshold: int = 10000, return_scores: bool = False) -> Union[tuple[list[str], PCA, int], tuple[list[str], PCA, int, np.ndarray]]:
     """
     Perform Principal Component Analysis (PCA) on tag data and plot the results.
 
@@ -338,9 +380,13 @@ def plot_pca_tags(data: pd.DataFrame, n_components_for_variance: int = 0, show_p
 
     show_plots (str, optional): Flag to specify which plots to display. Default is an empty string.
 
+    incremental_threshold (int, optional): Number of records above which the PCA is fitted in mini-batches using IncrementalPCA, to bound memory use. Default is 10000.
+
+    return_scores (bool, optional): Flag to also return the scores of the records on the components explaining 80% variance. Default is False.
+
     Return:
     -----------
-    tuple: A tuple containing a list of group names, PCA model, and the number of components for 80% variance.
+    tuple: A tuple containing a list of group names, PCA model, and the number of components for 80% variance, followed by the record scores if return_scores is set.
     """
     column_names = list(data.columns)
     # You need to define assign_group function
@@ -349,10 +395,18 @@ def plot_pca_tags(data: pd.DataFrame, n_components_for_variance: int = 0, show_p
     # You need to define transform_dataframe function
     X, y, targets, features = transform_dataframe(data, groups, group_list)
 
-    scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(X)
-    pca = PCA()
-    pca.fit_transform(X_scaled)
+    if is_binary(X):
+        # presence/absence tags share a scale already, PCA centers them itself and unit variance would inflate rare tags
+        X_scaled = X
+    else:
+        scaler = StandardScaler()
+        X_scaled = scaler.fit_transform(X)
+    if X_scaled.shape[0] > incremental_threshold:
+        # batches hold at least as many records as tags so that all components are retained
+        pca = IncrementalPCA(batch_size=max(1024, X_scaled.shape[1]))
+    else:
+        pca = PCA()
+    pca.fit(X_scaled)
 
     explained_variance_ratio = pca.explained_variance_ratio_
     cumulative_variance = np.cumsum(explained_variance_ratio)
@@ -484,6 +538,10 @@ def plot_pca_tags(data: pd.DataFrame, n_components_for_variance: int = 0, show_p
         plots(show_plots)
         plt.show()
 
+    if return_scores:
+        # project onto the leading components of the fitted model only, instead of transforming to all components
+        scores = (X_scaled - pca.mean_) @ pca.components_[:num_components_for_80_variance].T
+        return main_tags, pca, num_components_for_80_variance, scores
     return main_tags, pca, num_components_for_80_variance
 
 
@@ -557,18 +615,32 @@ def retrieve_clusters(input_file: str, output: str, variables: str, id: str, tag
     -----------
     pd.DataFrame: DataFrame containing clustered data.
     """
-    def retrieve_metadata_from_title(dataframe_a: pd.DataFrame, title_col_a: str, dataframe_b: pd.DataFrame, title_col_b: str) -> pd.DataFrame:
-        "Return all data for each row in dataframe_b that has a matching title in dataframe_a"
-        merged_df = pd.merge(dataframe_a[title_col_a], dataframe_b,
+    def retrieve_metadata_from_title(dataframe_a: pd.DataFrame, title_col_a: str, dataframe_b: pd.DataFrame, title_col_b: str, columns_a: tuple = ()) -> pd.DataFrame:
+        "Return all data for each row in dataframe_b that has a matching title in dataframe_a, along with the columns_a of dataframe_a"
+        merged_df = pd.merge(dataframe_a[[title_col_a, *columns_a]], dataframe_b,
                              how='inner', left_on=title_col_a, right_on=title_col_b)
         return merged_df
 
+    def retrieve_metadata_per_cluster(Dataframe_filtered_kmeans, input_csv, number_of_clusters) -> list:
+        "Return the metadata of the titles in each cluster, retrieved with a single merge over all clusters"
+        label_column = "Cluster"
+        while label_column in input_csv.columns:
+            label_column = f"_{label_column}"
+        cluster_titles = pd.DataFrame({'Article Title': Dataframe_filtered_kmeans.iloc[:, 0].to_numpy(),
+                                       label_column: Dataframe_filtered_kmeans['Cluster'].to_numpy()})
+        cluster_metadata = retrieve_metadata_from_title(
+            cluster_titles, "Article Title", input_csv, "Article Title", (label_column,))
+        groups = {cluster: group.drop(columns=label_column) for cluster, group in cluster_metadata.groupby(label_column, sort=False)}
+        empty = cluster_metadata.iloc[:0].drop(columns=label_column)
+        return [groups.get(i, empty) for i in range(number_of_clusters)]
+
     def perform_kmeans_clustering(scores_pca, max_clusters):
         "Perform k-means clustering up to the max cluster size and return a figure showing the inertia/fit."
         wcss = []
         for i in range(1, (max_clusters + 1)):
-            kmeans_pca = KMeans(
-                n_clusters=i, init='k-means++', random_state=42)
+            # the elbow only needs an estimate of the inertia, the final clustering below uses the full KMeans
+            kmeans_pca = MiniBatchKMeans(
+                n_clusters=i, init='k-means++', n_init=1, batch_size=4096, random_state=42)
             kmeans_pca.fit(scores_pca)
             wcss.append(kmeans_pca.inertia_)
 
@@ -606,7 +678,7 @@ def retrieve_clusters(input_file: str, output: str, variables: str, id: str, tag
             axs[i].axis('off')
         plt.show()
 
-    def save_cluster_data(Dataframe_filtered_kmeans, input_file, file_name, number_of_clusters, separator: str = ";") -> None:
+    def save_cluster_data(Dataframe_filtered_kmeans, input_csv, file_name, number_of_clusters) -> None:
         """
         Save cluster data to separate CSV files for each cluster.
 
@@ -614,25 +686,19 @@ def retrieve_clusters(input_file: str, output: str, variables: str, id: str, tag
         -----------
         Dataframe_filtered_kmeans (pd.DataFrame): DataFrame containing PCA components and cluster labels.
 
-        input_file (str): Path to the input file.
+        input_csv (pd.DataFrame): Records of the input file.
 
         file_name (str): Base name for the output CSV files.
 
         number_of_clusters (int): Number of clusters.
         """
-        for i in range(number_of_clusters):
+        clusters_metadata = retrieve_metadata_per_cluster(Dataframe_filtered_kmeans, input_csv, number_of_clusters)
+        for i, cluster_original_data in enumerate(clusters_metadata):
             cluster = i + 1
-            cluster_data_PCA = Dataframe_filtered_kmeans[
-                Dataframe_filtered_kmeans['Cluster'] == i].copy()
-            cluster_data_PCA.rename(columns={list(cluster_data_PCA)[
-                                    0]: 'Article Title'}, inplace=True)
-            input_csv = pd.read_csv(input_file, sep = separator)
-            cluster_original_data = retrieve_metadata_from_title(
-                cluster_data_PCA, "Article Title", input_csv, "Article Title")
             cluster_file_name = f"C:/NLPvenv/NLP/output/csv/{file_name}_cluster_{cluster}.csv"
             cluster_original_data.to_csv(cluster_file_name, index=False)
     
-    def save_cluster_data_merged(Dataframe_filtered_kmeans, input_file, file_name, number_of_clusters, separator: str = ";") -> None:
+    def save_cluster_data_merged(Dataframe_filtered_kmeans, input_csv, file_name, number_of_clusters) -> None:
         """
         Save cluster data to separate CSV files for each cluster.
 
@@ -640,26 +706,19 @@ def retrieve_clusters(input_file: str, output: str, variables: str, id: str, tag
         -----------
         Dataframe_filtered_kmeans (pd.DataFrame): DataFrame containing PCA components and cluster labels.
 
-        input_file (str): Path to the input file.
+        input_csv (pd.DataFrame): Records of the input file.
 
         file_name (str): Base name for the output CSV files.
 
         number_of_clusters (int): Number of clusters.
         """
-        clusters_original_data = pd.DataFrame()
-        for i in range(number_of_clusters):
+        clusters_metadata = retrieve_metadata_per_cluster(Dataframe_filtered_kmeans, input_csv, number_of_clusters)
+        cluster_parts = []
+        for i, cluster_original_data in enumerate(clusters_metadata):
             cluster = i + 1
-            cluster_data_PCA = Dataframe_filtered_kmeans[
-                Dataframe_filtered_kmeans['Cluster'] == i].copy()
-            cluster_data_PCA.rename(columns={list(cluster_data_PCA)[
-                                    0]: 'Article Title'}, inplace=True)
-            input_csv = pd.read_csv(input_file, sep = separator)
-            cluster_original_data = retrieve_metadata_from_title(
-                cluster_data_PCA, "Article Title", input_csv, "Article Title")
-            cluster_original_data["Cluster"] = cluster
-            clusters_original_data = pd.concat([clusters_original_data, pd.DataFrame(cluster_original_data)])
-            clusters_original_data = clusters_original_data.reset_index(drop=True)
-        
+            cluster_parts.append(cluster_original_data.assign(Cluster=cluster))
+        clusters_original_data = pd.concat(cluster_parts, ignore_index=True)
+
         cluster_file_name = f"C:/NLPvenv/NLP/output/csv/{file_name}_all_clusters.csv"
         clusters_original_data.to_csv(cluster_file_name, index=False)
             
@@ -671,12 +730,9 @@ def retrieve_clusters(input_file: str, output: str, variables: str, id: str, tag
     if transpose:
         Dataframe_filtered = Dataframe_filtered.transpose()
 
-    x, pca, num_components_for_80_variance = plot_pca_tags(
-        Dataframe_filtered, n_components_for_variance, show_plots)
-
-    pca = PCA(num_components_for_80_variance)
-    pca.fit(Dataframe_filtered)
-    scores_pca = pca.transform(Dataframe_filtered)
+    # the scores come from the same fit that determines the number of components, rather than from a second PCA
+    x, pca, num_components_for_80_variance, scores_pca = plot_pca_tags(
+        Dataframe_filtered, n_components_for_variance, show_plots, return_scores=True)
 
     number_of_clusters, kmeans_pca = perform_kmeans_clustering(scores_pca, max_clusters)
 
@@ -695,13 +751,17 @@ def retrieve_clusters(input_file: str, output: str, variables: str, id: str, tag
     file_path = os.path.basename(input_file)
     file_name = os.path.splitext(file_path)[0]
 
+    if save_clusters in ("merged", "separate", "all"):
+        # both outputs are retrieved from the same records, so the csv is only parsed once
+        input_csv = pd.read_csv(input_file, sep=";")
+
     if save_clusters == "merged" or save_clusters == "all":
         save_cluster_data_merged(Dataframe_filtered_kmeans,
-                          input_file, file_name, number_of_clusters)
+                          input_csv, file_name, number_of_clusters)
 
     if save_clusters == "separate" or save_clusters == "all":
         save_cluster_data(Dataframe_filtered_kmeans,
-                          input_file, file_name, number_of_clusters)
+                          input_csv, file_name, number_of_clusters)
     return Dataframe_filtered_kmeans
 
 if __name__ == "__main__":
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from scholarly import ProxyGenerator, scholarly
 from scidownl import scihub_download
 
@@ -105,7 +107,7 @@ def get_author_publications(full_author_name: str) -> list:
     return publication_list
 
 
-def get_author_bibliography(full_author_name: str) -> dict:
+def get_author_bibliography(full_author_name: str, max_workers: int = 1) -> dict:
     """
     Collects metadata of all found articles for a given author. Metadata includes the fields: title, authors, year, journal and link.
 
@@ -113,16 +115,18 @@ def get_author_bibliography(full_author_name: str) -> dict:
     -----------
     full_author_name (str): Complete author name (acquired with lookup_author) of the article.
 
+    max_workers (int): Number of articles to look up concurrently. Defaults to 1, as many parallel scholar queries are more likely to get blocked.
+
     Return: 
     -----------
     bibliography (dict): Dictionary of all found articles.
     """
     bibliography = {}
     publications = get_author_publications(full_author_name)
-    for title in publications:
-        pub_data = get_article(title)
-        bibliography[pub_data['title']] = pub_data
-        print(pub_data)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for pub_data in executor.map(get_article, publications):
+            bibliography[pub_data['title']] = pub_data
+            print(pub_data)
     return bibliography
 
 
@@ -176,6 +180,25 @@ def scihub_download_pdf(paper: dict, output_folder: str = "/input/pdf") -> None:
     return
 
 
+def scihub_download_pdfs(papers: list, output_folder: str = "/input/pdf", max_workers: int = 8) -> None:
+    """
+    Downloads the PDFs of multiple articles concurrently, so the latency of one download overlaps with the others. See scihub_download_pdf.
+
+    Parameters:
+    -----------
+    papers (list): List of dictionaries containing the paper 'title' and 'link'.
+    output_folder: The folder to store the pdf files in. Defaults to /input/pdf.
+    max_workers (int): Maximum number of simultaneous downloads. Defaults to 8.
+
+    Return:
+    -----------
+    None
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(lambda paper: scihub_download_pdf(paper, output_folder), papers))
+    return
+
+
 def get_first_article(author) -> None:
     """Downloads the first article of a given author."""
     first_article = {}
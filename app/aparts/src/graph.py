@@ -38,6 +38,38 @@ def find_value_and_delete_upper_level_entry(dictionary, value) -> dict:
     return new_dict
 
 
+def find_values_and_delete_upper_level_entries(dictionary: dict, values: set) -> dict:
+    """
+    Removes all (upper level) entries of any of the given values from a (nested) dictionary in a single pass.
+
+    Parameters:
+    -----------
+    dictionary (dict): (Nested) dictionary.
+
+    values (set): Names of the values from which the parent items should be removed.
+
+    Returns:
+    -----------
+    new_dict (dict): Corrected dictionary. 
+    """
+    new_dict = {}
+
+    for key, val in dictionary.items():
+        if isinstance(val, dict):
+            new_val = find_values_and_delete_upper_level_entries(val, values)
+            if new_val:
+                new_dict[key] = new_val
+        else:
+            try:
+                remove = val in values
+            except TypeError:
+                remove = False
+            if not remove:
+                new_dict[key] = val
+
+    return new_dict
+
+
 def flatten_nested_dict_value_to_list(dictionary: dict, value: str) -> list:
     """
     Returns all entries within the provided value of a dictionary as an unordered list.
@@ -81,18 +113,17 @@ def remove_dead_links_from_reference_dict(check_dict: dict, check_key: str, comp
     new_dict (dict): Dictionary of corrected source-destination relationships.
     """
     new_dict = check_dict.copy()
-    items_with_data = flatten_nested_dict_value_to_list(
-        compare_dict, compare_key)
-    items_to_check = flatten_nested_dict_value_to_list(check_dict, check_key)
-    for item in items_to_check:
-        if feedback == True:
-            if item in items_with_data:
-                new_dict = find_value_and_delete_upper_level_entry(
-                    new_dict, item)
-        if feedback == False:
-            if item not in items_with_data:
-                new_dict = find_value_and_delete_upper_level_entry(
-                    new_dict, item)
+    items_with_data = set(flatten_nested_dict_value_to_list(
+        compare_dict, compare_key))
+    items_to_check = set(flatten_nested_dict_value_to_list(check_dict, check_key))
+    dead_links = set()
+    if feedback == True:
+        dead_links = items_to_check & items_with_data
+    if feedback == False:
+        dead_links = items_to_check - items_with_data
+    if dead_links:
+        new_dict = find_values_and_delete_upper_level_entries(
+            new_dict, dead_links)
     return new_dict
 
 
@@ -104,13 +135,16 @@ def file_name_to_title(filename: str, CSV: str, separator: str = ";") -> str:
     -----------
     filename (str): Filename for a dataframe item.
 
-    CSV (str): Path to the reference dataframe.
+    CSV (str): Path to the reference dataframe, or the already loaded dataframe.
 
     Returns:
     -----------
     title (str): Corresponding reference title.
     """
-    source_frame = pd.read_csv(CSV, sep = separator)
+    if isinstance(CSV, pd.DataFrame):
+        source_frame = CSV
+    else:
+        source_frame = pd.read_csv(CSV, sep = separator)
     row = source_frame.loc[source_frame['file'] == filename]
     title = row['title']
     return title
@@ -134,9 +168,10 @@ def replace_filenames_by_title(column_name: str, dictionary: dict, CSV: str) ->
     """
     dictionary_fixed = {}
     try:
+        source_frame = pd.read_csv(CSV, sep = ";")
         for key, item in dictionary.items():
             filename = item[column_name]
-            title = file_name_to_title(filename, CSV)
+            title = file_name_to_title(filename, source_frame)
             current_item = item
             current_item[column_name] = title
             dictionary_fixed.update(current_item)
@@ -444,10 +479,15 @@ def graph_view(totalCSV: str, path_to_references: str, height: str, width: str,
             source = e[0]
             destination = e[1]
             color = e[2]
-            net.add_node(source, source, level=level_source,
-                         color=color_scheme[color], size=size_source, borderWidthSelected=18, group=group_source, title=source)
-            net.add_node(destination, destination, level=level_destination,
-                         color=color_scheme[color], size=size_destination, borderWidthSelected=18, group=group_destination, title=destination)
+            # pyvis checks node membership against a list, so keep track of added nodes in a set
+            if source not in node_ids:
+                net.add_node(source, source, level=level_source,
+                             color=color_scheme[color], size=size_source, borderWidthSelected=18, group=group_source, title=source)
+                node_ids.add(source)
+            if destination not in node_ids:
+                net.add_node(destination, destination, level=level_destination,
+                             color=color_scheme[color], size=size_destination, borderWidthSelected=18, group=group_destination, title=destination)
+                node_ids.add(destination)
             net.add_edge(source, destination, value=5, color=color_scheme[5])
 
     if os.path.isfile(path_to_references):
@@ -461,6 +501,7 @@ def graph_view(totalCSV: str, path_to_references: str, height: str, width: str,
                   bgcolor="#222222", font_color="white", directed=True, filter_menu=True)
     #net.barnes_hut()
     net.force_atlas_2based(central_gravity=0.02, spring_length=60, spring_strength=0.2, overlap=1, gravity=-100)
+    node_ids = set()
 
     # substitute filenames by titlenames
     inter_reference_dict = replace_filenames_by_title(
@@ -510,8 +551,9 @@ def graph_view(totalCSV: str, path_to_references: str, height: str, width: str,
     neighbor_map = net.get_adj_list()
     # add neighbor data to node hover data
     for node in net.nodes:
-        node["value"] = len(neighbor_map[node["id"]])
-        node["title"] += " Neighbors:<br>" + "<br>".join(neighbor_map[node["id"]])
+        neighbors = neighbor_map[node["id"]]
+        node["value"] = len(neighbors)
+        node["title"] += " Neighbors:<br>" + "<br>".join(neighbors)
     net.set_edge_smooth("dynamic")
     #net.show_buttons('physics')
     net.show(f"{folder_name}/{graph_name}.html", notebook=False)
@@ -2,9 +2,22 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from numpy.random import default_rng
-from scipy.spatial.distance import braycurtis
+from scipy.spatial.distance import pdist, squareform
 from sklearn.cluster import KMeans
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback that leaves the function untouched when numba is not installed."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda function: function
+
 
 def generate_binary_item_matrix(CSV_path: str = "", y: str = "keywords", x: str = "title", keyword_length: int = 3, number_of_records: int = "", delimiter: str = ", ", separator: str = ";") -> tuple[pd.DataFrame, list]:
     """
@@ -62,7 +75,7 @@ def generate_binary_item_matrix(CSV_path: str = "", y: str = "keywords", x: str
     return binary_matrix_df, rows_list
 
 
-def generate_bray_curtis_dissimilarity(binary_matrix: pd.DataFrame) -> np.ndarray:
+def generate_bray_curtis_dissimilarity(binary_matrix: pd.DataFrame, dtype: np.dtype = np.float32) -> np.ndarray:
     """
     Calculate 3D bray-curtis dissimilarities for items in a binary matrix.
 
@@ -70,23 +83,27 @@ def generate_bray_curtis_dissimilarity(binary_matrix: pd.DataFrame) -> np.ndarra
     -----------
     binary_matrix (numpy.ndarray): boolean matrix of items by tag presence.
 
+    dtype (np.dtype): Floating point precision of the returned coordinates. Defaults to float32.
+
     Returns:
     --------
     continuous_dimensions (numpy.ndarray): 3D dissimilarity matrix of continuous values.
     """
-    num_rows = binary_matrix.shape[0]
-    dissimilarity_matrix = np.zeros((num_rows, num_rows))
-
-    for i in range(num_rows):
-        for j in range(i+1, num_rows):
-            dissimilarity = braycurtis(
-                binary_matrix.iloc[i], binary_matrix.iloc[j])
-            dissimilarity_matrix[i, j] = dissimilarity
-            dissimilarity_matrix[j, i] = dissimilarity
+    items = binary_matrix.to_numpy()
+    if is_binary(items):
+        items = items.astype(bool, copy=False)
+        if NUMBA_AVAILABLE:
+            dissimilarity_matrix = packed_bray_curtis(pack_rows(items))
+        else:
+            dissimilarity_matrix = squareform(pdist(items, metric="braycurtis"))
+    else:
+        items = np.ascontiguousarray(items, dtype=dtype)
+        dissimilarity_matrix = squareform(pdist(items, metric="braycurtis"))
 
     eigenvalues, eigenvectors = np.linalg.eigh(dissimilarity_matrix)
     sorted_indices = np.argsort(eigenvalues)[::-1]
-    pca_coordinates = eigenvectors[:, sorted_indices[:3]]
+    # the eigendecomposition stays in float64 as near-equal eigenvalues are unstable in float32
+    pca_coordinates = eigenvectors[:, sorted_indices[:3]].astype(dtype, copy=False)
 
     rng = default_rng(42)
     resampled_indices = rng.choice(
@@ -97,7 +114,78 @@ def generate_bray_curtis_dissimilarity(binary_matrix: pd.DataFrame) -> np.ndarra
     return continuous_dimensions
 
 
-def calculate_euclidean_distance_matrix(matrix: np.ndarray) -> np.ndarray:
+def is_binary(matrix: np.ndarray) -> bool:
+    """Check whether a matrix only contains presence/absence values."""
+    return matrix.dtype == bool or bool(((matrix == 0) | (matrix == 1)).all())
+
+
+def pack_rows(matrix: np.ndarray) -> np.ndarray:
+    """
+    Pack the rows of a binary matrix into 64-bit words, padding each row with zeros to a multiple of 64 columns.
+
+    Parameters:
+    -----------
+    matrix (np.ndarray): boolean matrix of items by tag presence.
+
+    Returns:
+    --------
+    packed_matrix (np.ndarray): uint64 matrix holding 64 tags per word.
+    """
+    packed_matrix = np.packbits(matrix, axis=1)
+    padding = -packed_matrix.shape[1] % 8
+    if padding:
+        packed_matrix = np.pad(packed_matrix, ((0, 0), (0, padding)))
+    return np.ascontiguousarray(packed_matrix).view(np.uint64)
+
+
+@njit(inline="always")
+def popcount64(word):
+    """Count the set bits of a 64-bit word, which LLVM lowers to a single popcnt instruction."""
+    word = word - ((word >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    word = (word & np.uint64(0x3333333333333333)) + ((word >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    word = (word + (word >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return (word * np.uint64(0x0101010101010101)) >> np.uint64(56)
+
+
+@njit(parallel=True, cache=True)
+def packed_bray_curtis(packed_matrix: np.ndarray) -> np.ndarray:
+    """
+    Calculate pairwise bray-curtis dissimilarities between the rows of a bit-packed binary matrix.
+
+    For presence/absence rows a and b the dissimilarity equals (|a| + |b| - 2|a & b|) / (|a| + |b|), which is computed on 64 tags at a time by counting the set bits of each word.
+
+    Parameters:
+    -----------
+    packed_matrix (np.ndarray): uint64 matrix of rows packed with pack_rows.
+
+    Returns:
+    --------
+    dissimilarity_matrix (np.ndarray): Square matrix of bray-curtis dissimilarities.
+    """
+    num_rows, num_words = packed_matrix.shape
+    counts = np.zeros(num_rows, dtype=np.int64)
+    for i in range(num_rows):
+        for k in range(num_words):
+            counts[i] += popcount64(packed_matrix[i, k])
+
+    dissimilarity_matrix = np.zeros((num_rows, num_rows))
+    for i in prange(num_rows):
+        for j in range(i + 1, num_rows):
+            shared = 0
+            for k in range(num_words):
+                shared += popcount64(packed_matrix[i, k] & packed_matrix[j, k])
+            total = counts[i] + counts[j]
+            if total > 0:
+                dissimilarity = (total - 2 * shared) / total
+            else:
+                dissimilarity = np.nan
+            dissimilarity_matrix[i, j] = dissimilarity
+            dissimilarity_matrix[j, i] = dissimilarity
+
+    return dissimilarity_matrix
+
+
+def calculate_euclidean_distance_matrix(matrix: np.ndarray, dtype: np.dtype = np.float32) -> np.ndarray:
     """
     Calculate the Euclidean distance matrix for a 3D numpy array.
 
@@ -105,18 +193,14 @@ def calculate_euclidean_distance_matrix(matrix: np.ndarray) -> np.ndarray:
     -----------
     matrix (np.ndarray): 3D numpy array.
 
+    dtype (np.dtype): Floating point precision of the distance matrix. Defaults to float32.
+
     Returns:
     --------
     distance_matrix (np.ndarray): Euclidean distance matrix.
     """
-    num_items = matrix.shape[0]
-    distance_matrix = np.zeros((num_items, num_items))
-
-    for i in range(num_items):
-        for j in range(i + 1, num_items):
-            distance = np.linalg.norm(matrix[i] - matrix[j])
-            distance_matrix[i, j] = distance
-            distance_matrix[j, i] = distance
+    items = np.ascontiguousarray(matrix.reshape(matrix.shape[0], -1), dtype=dtype)
+    distance_matrix = squareform(pdist(items, metric="euclidean")).astype(dtype, copy=False)
 
     return distance_matrix
 
@@ -168,24 +252,55 @@ def select_items_by_distance(distance_matrix: np.ndarray, n: int, continuous_dim
             continuous_dimensions[largest_cluster_items] - largest_cluster_centroid, axis=1))]
         selected_items.append(starting_item)
 
-    for _ in range(n - 1):
-        item_sums = np.sum(
-            distance_matrix[selected_items][:, np.newaxis], axis=0).ravel()
-        # Set previously selected items' sums to -inf
-        item_sums[selected_items] = -np.inf
+    if n < 1:
+        # the starting item is always returned, as the greedy selection below needs room for at least one item
+        return [int(selected_items[0])]
 
-        masked_sums = np.ma.array(item_sums, mask=False)
-        # Mask previously selected items
-        masked_sums[selected_items] = np.ma.masked
+    if distance_matrix.dtype not in (np.float32, np.float64):
+        distance_matrix = distance_matrix.astype(float)
+    selected_items = _select_by_distance_sums(np.ascontiguousarray(
+        distance_matrix), n, selected_items[0], distance_type == "dissimilarity")
 
-        if distance_type == "dissimilarity":
-            next_item = np.ma.argmax(masked_sums)
-        elif distance_type == "similarity":
-            next_item = np.ma.argmin(masked_sums)
+    return selected_items.tolist()
 
-        selected_items.append(next_item)
 
-    return selected_items
+@njit(cache=True)
+def _select_by_distance_sums(distance_matrix: np.ndarray, n: int, first_item: int, maximize: bool) -> np.ndarray:
+    """
+    Greedily select items by their summed distance to the previously selected items.
+
+    Parameters:
+    -----------
+    distance_matrix (np.ndarray): Euclidean distance matrix.
+
+    n (int): Number of items to select.
+
+    first_item (int): Index of the first selected item.
+
+    maximize (bool): Pick the item with the highest summed distance if True, the lowest otherwise.
+
+    Returns:
+    --------
+    selected (np.ndarray): Array of selected item indices.
+    """
+    selected = np.empty(n, dtype=np.int64)
+    taken = np.zeros(distance_matrix.shape[0], dtype=np.bool_)
+    item_sums = distance_matrix[first_item].copy()
+    fill = -np.inf if maximize else np.inf
+    selected[0] = first_item
+    taken[first_item] = True
+
+    for i in range(1, n):
+        candidates = np.where(taken, fill, item_sums)
+        if maximize:
+            next_item = np.argmax(candidates)
+        else:
+            next_item = np.argmin(candidates)
+        selected[i] = next_item
+        taken[next_item] = True
+        item_sums += distance_matrix[next_item]
+
+    return selected
 
 
 def get_selected_coordinates(selected_items: list, distance_matrix: np.ndarray) -> np.ndarray:
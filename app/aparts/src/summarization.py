@@ -1,15 +1,24 @@
+import numpy as np
 import spacy
+from spacy.attrs import LOWER
 from spacy.lang.en.stop_words import STOP_WORDS
+from spacy.strings import hash_string
 from string import punctuation
 from heapq import nlargest
+from functools import lru_cache
 from aparts.src.weighted_tagging import split_text_to_sections
 from aparts.src.APT import list_filenames, guarantee_csv_exists
 import pandas as pd
 import os
 
+@lru_cache(maxsize=None)
+def load_language_model(model:str = 'en_core_web_sm'):
+    """Load a spaCy language model once per process, leaving out the components that summarization does not use."""
+    return spacy.load(model, disable=['ner', 'lemmatizer'])
+
 def remove_repeating_sentences(sentence_tokens:list, sections:dict)->list:
     """
-    Removes sentences that occur in all sections, such as footnotes, from a list of tokens.
+    Removes sentences that occur in all sections, such as footnotes, from a list of tokens. Sentences that are repeated within the text are only kept once.
 
     Parameters:
     -----------
@@ -22,12 +31,15 @@ def remove_repeating_sentences(sentence_tokens:list, sections:dict)->list:
     sentence_tokens_filtered (list): List of filtered tokenized sentences.
     """
     sentence_tokens_filtered = []
+    seen_sentences = set()
     for item in sentence_tokens:
         sentence = item.text
-        for section in sections.values():
-            if sentence not in section:
-                sentence_tokens_filtered.append(item)
-            else: None
+        key = sentence.strip().lower()
+        if key in seen_sentences:
+            continue
+        seen_sentences.add(key)
+        if any(sentence not in section for section in sections.values()):
+            sentence_tokens_filtered.append(item)
     return sentence_tokens_filtered
 
 def generate_sentence_tokens(text:str) -> tuple[list, dict]:
@@ -47,12 +59,11 @@ def generate_sentence_tokens(text:str) -> tuple[list, dict]:
     word_frequencies (dict): Dictionary of words and corresponding frequency in the source text.
 
     """
-    nlp = spacy.load('en_core_web_sm')
+    nlp = load_language_model()
     doc= nlp(text)
-    tokens=[token.text for token in doc]
     word_frequencies={}
     for word in doc:
-        if word.text.lower() not in list(STOP_WORDS):
+        if word.text.lower() not in STOP_WORDS:
             if word.text.lower() not in punctuation:
                 if word.text not in word_frequencies.keys():
                     word_frequencies[word.text] = 1
@@ -82,14 +93,25 @@ def summarize_tokens(sentence_tokens: list, word_frequencies: dict, amount: int,
     -----------
     summary (str): Summarized representation of the source file.
     """
+    if not word_frequencies:
+        return ""
+    # look up the frequency of every token at once by matching the hashes of their lowercase forms
+    word_hashes = np.array([hash_string(word) for word in word_frequencies], dtype=np.uint64)
+    frequencies = np.array(list(word_frequencies.values()), dtype=float)
+    order = np.argsort(word_hashes)
+    word_hashes, frequencies = word_hashes[order], frequencies[order]
+    token_scores = {}
     sentence_scores = {}
     for sent in sentence_tokens:
-        for word in sent:
-            if word.text.lower() in word_frequencies.keys():
-                if sent not in sentence_scores.keys():                            
-                    sentence_scores[sent]=word_frequencies[word.text.lower()]
-                else:
-                    sentence_scores[sent]+=word_frequencies[word.text.lower()]
+        if id(sent.doc) not in token_scores:
+            lowercase_hashes = sent.doc.to_array(LOWER)
+            positions = np.searchsorted(word_hashes, lowercase_hashes).clip(max=len(word_hashes) - 1)
+            matches = word_hashes[positions] == lowercase_hashes
+            token_scores[id(sent.doc)] = np.where(matches, frequencies[positions], 0.0), matches
+        scores, matches = token_scores[id(sent.doc)]
+        if matches[sent.start:sent.end].any():
+            # summed left to right like the per-token loop, so tied sentences keep their order
+            sentence_scores[sent] = sum(scores[sent.start:sent.end].tolist(), sentence_scores.get(sent, 0))
     select_length=amount+offset
     start_position = 0 + offset
     summary=nlargest(select_length, sentence_scores,key=sentence_scores.get)
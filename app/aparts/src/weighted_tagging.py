@@ -1,5 +1,6 @@
 import os.path as ospath
 import re
+from collections import Counter
 from os import listdir
 from typing import Dict
 
@@ -32,6 +33,9 @@ patterns = {
     "conclusion": conclusion_pattern,
     "references": references_pattern,
 }
+compiled_patterns = {section: re.compile(pattern, flags=re.IGNORECASE | re.DOTALL)
+                     for section, pattern in patterns.items()}
+typographic_line_break_pattern = re.compile(r'(?<=[a-zA-Z0-9])- (?=[a-zA-Z0-9])')
 sections = {
     "abstract": "",
     "keywords": "",
@@ -47,7 +51,15 @@ sections = {
 ## data preprocessing
 
 def open_file(file: str) -> str:
-    text = open(file, "rb").readlines()
+    with open(file, "rb") as f:
+        text = f.readlines()
+    return text
+
+
+def read_file(file: str, encoding: str = "utf-8") -> str:
+    """Reads and decodes a text file in a single call instead of line by line."""
+    with open(file, "rb") as f:
+        text = f.read().decode(encoding)
     return text
 
 
@@ -68,17 +80,16 @@ def prepare_bytes_for_pattern(text: str) -> str:
     return text
 
 def remove_typographic_line_breaks(text):
-    pattern = r'(?<=[a-zA-Z0-9])- (?=[a-zA-Z0-9])'
-    return re.sub(pattern, '', text)
+    return typographic_line_break_pattern.sub('', text)
 
-def extract_sections(text: str, patterns: dict = patterns, sections: dict = sections) -> dict:
+def extract_sections(text: str, patterns: dict = compiled_patterns, sections: dict = sections) -> dict:
     """
     Extracts the sections from the input text and returns a dictionary
     where each key is a section and the value is the text for that section.
 
     Parameters:
     text (str): The source string
-    patterns (dict): dictionary of regex headers to match
+    patterns (dict): dictionary of regex headers to match, either as strings or precompiled patterns
     sections (dict): empty dictionary of headers
 
     Returns:
@@ -86,7 +97,9 @@ def extract_sections(text: str, patterns: dict = patterns, sections: dict = sect
     """
     sorted_matches = {}
     for section, pattern in patterns.items():
-        match = re.finditer(pattern, text, flags=re.IGNORECASE | re.DOTALL)
+        if not isinstance(pattern, re.Pattern):
+            pattern = re.compile(pattern, flags=re.IGNORECASE | re.DOTALL)
+        match = pattern.finditer(text)
         last_match = None
         for m in match:
             last_match = m
@@ -148,14 +161,8 @@ def count_keyword_occurrences(section_dictionary: dict, keylist: list) -> dict:
     word_counts = {}
 
     for section_name, section_text in section_dictionary.items():
-        section_word_counts = {}
-        words = section_text.split()
-
-        for word in keylist:
-            count = words.count(word)
-            section_word_counts[word] = count
-
-        word_counts[section_name] = section_word_counts
+        words = Counter(section_text.split())
+        word_counts[section_name] = {word: words[word] for word in keylist}
     return word_counts
 
 
@@ -289,9 +296,7 @@ def split_text_to_sections(text: str) -> dict:
     Returns:
     dict (dict:str): Dictionary of the sections  
     """
-    text = open_file(text)
-    string_list = [byte.decode('utf-8') for byte in text]
-    text = ''.join(string_list)
+    text = read_file(text)
     text = prepare_bytes_for_pattern(text)
     text = remove_typographic_line_breaks(text)
     dict = extract_sections(text)
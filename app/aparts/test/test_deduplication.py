@@ -0,0 +1,125 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import pairwise_distances
+
+from aparts.src.deduplication import (deduplicate_tag_conjugations,
+                                      generate_tag_dissimilarity,
+                                      group_tags_by_dissimilarity)
+
+
+class TestGenerateTagDissimilarity(unittest.TestCase):
+    def test_generate_tag_dissimilarity_exact_ratio(self):
+        # 10 observations each with 3 shared, a bray-curtis dissimilarity of exactly 0.7
+        dataframe = pd.DataFrame({
+            'Tag1': [1] * 10 + [0] * 7,
+            'Tag2': [0] * 7 + [1] * 10
+        })
+
+        result = generate_tag_dissimilarity(dataframe)
+
+        self.assertEqual(result.dtype, np.float64)
+        self.assertEqual(result[0, 1], 0.7)
+        self.assertEqual(group_tags_by_dissimilarity(result, dataframe.columns, threshold=0.7), [])
+
+    def test_generate_tag_dissimilarity_dtypes(self):
+        rng = np.random.default_rng(0)
+        tags = rng.random((70, 12)) < 0.3
+        # tags without observations have no defined dissimilarity to other tags
+        tags[:, [3, 7]] = False
+        with np.errstate(invalid="ignore"):
+            expected = pairwise_distances(tags.T.astype(float), metric="braycurtis")
+
+        for dtype in (bool, int, float):
+            dataframe = pd.DataFrame(tags.astype(dtype))
+            for numba_available in (True, False):
+                with patch("aparts.src.deduplication.NUMBA_AVAILABLE", numba_available):
+                    result = generate_tag_dissimilarity(dataframe)
+
+                np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+    def test_generate_tag_dissimilarity_counts(self):
+        rng = np.random.default_rng(0)
+        dataframe = pd.DataFrame(rng.integers(0, 4, (30, 6)))
+
+        result = generate_tag_dissimilarity(dataframe)
+
+        np.testing.assert_allclose(result, pairwise_distances(dataframe.T, metric="braycurtis"))
+
+
+class TestGroupTagsByDissimilarity(unittest.TestCase):
+    def setUp(self):
+        self.tag_names = ["Tag1", "Tag2", "Tag3"]
+        self.pair_matrix = np.array([
+            [0.0, 0.5, 0.9],
+            [0.5, 0.0, 0.9],
+            [0.9, 0.9, 0.0]])
+        # Tag1 and Tag3 are only close through Tag2
+        self.chain_matrix = np.array([
+            [0.0, 0.3, 0.9],
+            [0.3, 0.0, 0.35],
+            [0.9, 0.35, 0.0]])
+
+    def test_group_tags_by_dissimilarity_at_threshold(self):
+        for linkage in ("average", "complete", "single"):
+            result = group_tags_by_dissimilarity(self.pair_matrix, self.tag_names, threshold=0.5, linkage=linkage)
+            self.assertEqual(result, [], linkage)
+
+    def test_group_tags_by_dissimilarity_below_threshold(self):
+        for linkage in ("average", "complete", "single"):
+            result = group_tags_by_dissimilarity(self.pair_matrix, self.tag_names, threshold=0.51, linkage=linkage)
+            self.assertEqual(result, [["Tag1", "Tag2"]], linkage)
+
+    def test_group_tags_by_dissimilarity_single(self):
+        result = group_tags_by_dissimilarity(self.chain_matrix, self.tag_names, threshold=0.4, linkage="single")
+
+        self.assertEqual(result, [["Tag1", "Tag2", "Tag3"]])
+        self.assertEqual(group_tags_by_dissimilarity(self.chain_matrix, self.tag_names, threshold=0.3, linkage="single"), [])
+
+    def test_group_tags_by_dissimilarity_average(self):
+        result = group_tags_by_dissimilarity(self.chain_matrix, self.tag_names, threshold=0.4, linkage="average")
+
+        self.assertEqual(result, [["Tag1", "Tag2"]])
+
+
+class TestDeduplicateTagConjugations(unittest.TestCase):
+    def setUp(self):
+        self.word_list = ["mosquito", "mosquitoes", "culex", "mosquitoes",
+                          ["larva", "larvae", ["wetland", "wetlands", "wet"]], "cul"]
+
+    def test_deduplicate_tag_conjugations(self):
+        result = deduplicate_tag_conjugations(self.word_list)
+
+        self.assertEqual(result, ["mosquitoes", "culex", ["larvae", ["wetlands"]]])
+
+    def test_deduplicate_tag_conjugations_pairs(self):
+        result = deduplicate_tag_conjugations(self.word_list, "pairs")
+
+        self.assertEqual(result, [("mosquitoes", "mosquitoes"), ("mosquito", "mosquitoes"), ("larva", "larvae"),
+                                  ("wetland", "wetlands"), ("wet", "wetlands"), ("cul", "culex")])
+
+    def test_deduplicate_tag_conjugations_prefix_chain(self):
+        word_list = ["a", "abc", "ab", "abcd"]
+
+        self.assertEqual(deduplicate_tag_conjugations(word_list), ["abcd"])
+        self.assertEqual(deduplicate_tag_conjugations(word_list, "pairs"),
+                         [("abc", "abcd"), ("ab", "abcd"), ("a", "abcd")])
+
+    def test_deduplicate_tag_conjugations_shared_prefix(self):
+        result = deduplicate_tag_conjugations(["mosquito", "mosquitos", "mosquitoes"], "pairs")
+
+        self.assertEqual(result, [("mosquito", "mosquitoes")])
+
+    def test_deduplicate_tag_conjugations_retained_pairs(self):
+        deleted_pairs = [("larva", "larvae")]
+
+        result = deduplicate_tag_conjugations(["wet", "wetland"], "pairs", deleted_pairs)
+
+        self.assertIs(result, deleted_pairs)
+        self.assertEqual(result, [("larva", "larvae"), ("wet", "wetland")])
+
+
+if __name__ == '__main__':
+    unittest.main()
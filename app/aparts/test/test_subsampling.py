@@ -3,12 +3,15 @@ from unittest.mock import call, patch
 
 import numpy as np
 import pandas as pd
+from scipy.spatial.distance import pdist, squareform
 
 from aparts.src.subsampling import (assign_group,
                                     calculate_euclidean_distance_matrix,
                                     generate_binary_item_matrix,
                                     generate_bray_curtis_dissimilarity,
-                                    plot_array, select_items_by_distance,
+                                    pack_rows, packed_bray_curtis,
+                                    plot_array, popcount64,
+                                    select_items_by_distance,
                                     transform_dataframe)
 
 
@@ -43,6 +46,55 @@ class TestGenerateBrayCurtisDissimilarity(unittest.TestCase):
         self.assertEqual(result.shape, (binary_matrix.shape[1], 3))
 
 
+    def test_generate_bray_curtis_dissimilarity_without_numba(self):
+        rng = np.random.default_rng(0)
+        binary_matrix = pd.DataFrame((rng.random((20, 70)) < 0.3).astype(int))
+
+        result = generate_bray_curtis_dissimilarity(binary_matrix)
+        with patch("aparts.src.subsampling.NUMBA_AVAILABLE", False):
+            fallback = generate_bray_curtis_dissimilarity(binary_matrix)
+
+        np.testing.assert_allclose(np.abs(result), np.abs(fallback), atol=1e-6)
+
+
+class TestPackRows(unittest.TestCase):
+    def test_pack_rows(self):
+        rng = np.random.default_rng(0)
+        for num_columns in (1, 63, 64, 65, 130):
+            matrix = rng.random((3, num_columns)) < 0.5
+
+            result = pack_rows(matrix)
+
+            self.assertEqual(result.dtype, np.uint64)
+            self.assertEqual(result.shape, (3, -(-num_columns // 64)))
+            unpacked = np.unpackbits(result.view(np.uint8), axis=1)
+            np.testing.assert_array_equal(unpacked[:, :num_columns], matrix)
+            self.assertFalse(unpacked[:, num_columns:].any())
+
+
+class TestPopcount64(unittest.TestCase):
+    def test_popcount64(self):
+        rng = np.random.default_rng(0)
+        words = [0, 1, 2**63, 2**64 - 1] + rng.integers(0, 2**63, 20, dtype=np.uint64).tolist()
+        for word in words:
+            self.assertEqual(popcount64(np.uint64(word)), bin(word).count("1"))
+
+
+class TestPackedBrayCurtis(unittest.TestCase):
+    def test_packed_bray_curtis(self):
+        rng = np.random.default_rng(0)
+        for num_columns in (1, 63, 65, 130):
+            matrix = rng.random((12, num_columns)) < 0.3
+            # rows without observations have no defined dissimilarity
+            matrix[[2, 5]] = False
+
+            result = packed_bray_curtis(pack_rows(matrix))
+
+            with np.errstate(invalid="ignore"):
+                expected = squareform(pdist(matrix, metric="braycurtis"))
+            np.testing.assert_array_equal(result, expected)
+
+
 class TestCalculateEuclideanDistanceMatrix(unittest.TestCase):
     def test_calculate_euclidean_distance_matrix(self):
 
@@ -74,6 +126,21 @@ class TestSelectItemsByDistance(unittest.TestCase):
         self.assertIsInstance(result, list)
         self.assertEqual(len(result), 2)
 
+    def test_select_items_by_distance_no_items(self):
+        sample_distance_matrix = np.array([
+            [0.0, 14.69693846, 29.39387691],
+            [14.69693846,  0.0, 14.69693846],
+            [29.39387691, 14.69693846,  0.0]])
+        sample_continuous_dimensions = np.array([
+            [1, 2],
+            [4, 5],
+            [7, 8]
+        ])
+        result = select_items_by_distance(
+            sample_distance_matrix, 0, sample_continuous_dimensions, "dissimilarity", "centroid")
+
+        self.assertEqual(result, [1])
+
 
 class TestPlotArray(unittest.TestCase):
 
@@ -23,6 +23,8 @@ setup(
     install_requires=["anyascii>=0.3.2", "cleantext>=1.1.4", "fuzzywuzzy>=0.18.0", "gensim>=4.3.1", "keybert>=0.7.0", "matplotlib>=3.7.1", "networkx>=3.1", "nlp_rake>=0.0.2", "nltk>=3.8.1", "numpy>=1.24.3", "pandas>=2.0.1", "pybtex>=0.24.0", "PyPDF2>=3.0.1", "python_Levenshtein>=0.21.0", "pyvis>=0.3.2", "scholarly>=1.7.11", "scidownl>=1.0.2", "scipy>=1.10.1", "setuptools>=67.7.2", "six>=1.16.0", "spacy>=3.2.0", "yake>=0.4.8"],   
     extras_require={
         "dev": ["pytest>=7.0", "twine>=4.0.2"],
+        "speedups": ["numba>=0.57"],
+        "parquet": ["pyarrow>=10.0"],
     },
     python_requires=">=3.9.0",
 )